@@ -6,7 +6,15 @@ Supports GCP API Gateway, Azure API Management, and Cloudflare Workers
 __version__ = "2.0.0"
 __author__ = "OmniProx Contributors"
 
-from .core.base import BaseOmniProx
-from .core.utils import setup_logging
+__all__ = ['BaseOmniProx', 'setup_logging']
 
-__all__ = ['BaseOmniProx', 'setup_logging']
\ No newline at end of file
+
+def __getattr__(name):
+    """Lazily import public names so a bare `import omniprox` stays cheap"""
+    if name == 'BaseOmniProx':
+        from .core.base import BaseOmniProx
+        return BaseOmniProx
+    if name == 'setup_logging':
+        from .core.utils import setup_logging
+        return setup_logging
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
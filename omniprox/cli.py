@@ -3,20 +3,27 @@ OmniProx CLI - Command-line interface for multi-cloud HTTP proxy manager
 """
 
 import argparse
-import configparser
-import os
+import copy
+import importlib
 import sys
-import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 from typing import Optional
 
-from omniprox.core.utils import setup_logging, check_provider_availability, print_provider_status
+from omniprox.core.base import SEP, SUBSEP, load_profiles
+from omniprox.core.utils import (
+    setup_logging, check_provider_availability, print_provider_status, get_output_logger
+)
+
+# Per-provider progress goes through a logger so concurrent runs serialize on its lock
+_output = get_output_logger()
 
 
 def select_provider_interactive():
     """Interactive provider selection"""
-    print("\n" + "="*60)
+    print("\n" + SEP)
     print("Select Cloud Provider")
-    print("="*60)
+    print(SEP)
     print("Which cloud provider would you like to use?")
     print("  1. Cloudflare Workers (cf) - Best for IP rotation, 100k req/day free")
     print("  2. Google Cloud Platform (gcp) - 2M req/month free")
@@ -42,24 +49,72 @@ def select_provider_interactive():
             return None
 
 
+# Provider aliases accepted on the command line, mapped to canonical names
+_ALIASES = {
+    'gcp': 'gcp',
+    'azure': 'azure',
+    'az': 'azure',
+    'cloudflare': 'cloudflare',
+    'cf': 'cloudflare',
+    'alibaba': 'alibaba',
+}
+
+# Canonical provider name -> (module, class), imported only when requested
+_PROVIDER_CLASSES = {
+    'gcp': ('omniprox.providers.gcp', 'GCPProvider'),
+    'azure': ('omniprox.providers.azure', 'AzureProvider'),
+    'cloudflare': ('omniprox.providers.cloudflare', 'CloudflareProvider'),
+    'alibaba': ('omniprox.providers.alibaba', 'AlibabaProvider'),
+}
+
+
 def get_provider_class(provider: str):
-    if not check_provider_availability(provider):
+    name = _ALIASES.get(provider)
+    if name is None or not check_provider_availability(name):
         return None
 
-    if provider == 'gcp':
-        from omniprox.providers.gcp import GCPProvider
-        return GCPProvider
-    elif provider == 'azure' or provider == 'az':
-        from omniprox.providers.azure import AzureProvider
-        return AzureProvider
-    elif provider == 'cloudflare' or provider == 'cf':
-        from omniprox.providers.cloudflare import CloudflareProvider
-        return CloudflareProvider
-    elif provider == 'alibaba':
-        from omniprox.providers.alibaba import AlibabaProvider
-        return AlibabaProvider
+    module_name, class_name = _PROVIDER_CLASSES[name]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _run_one(provider: str, provider_args):
+    """Run the requested command for a single provider
+
+    Args:
+        provider: Provider name
+        provider_args: Arguments namespace for this provider
+
+    Returns:
+        tuple: (provider, success, error) where error describes a failure, if any
+    """
+    _output.info("\n[%s] Executing %s...", provider.upper(), provider_args.command)
+    _output.info(SUBSEP)
+
+    # Get the provider class
+    provider_class = get_provider_class(provider)
+    if not provider_class:
+        error = "Provider implementation not available"
+        _output.error("  Error: %s: %s", provider.upper(), error)
+        return provider, False, error
+
+    try:
+        # Initialize and execute
+        provider_instance = provider_class(provider_args)
+        success = bool(provider_instance.execute())
+    except Exception as e:
+        _output.error("  Error: %s: %s", provider.upper(), e)
+        return provider, False, str(e)
+
+    # Output from providers running side by side interleaves, so name the provider
+    if success:
+        _output.info("  [OK] %s: %s completed successfully", provider.upper(), provider_args.command)
+        return provider, True, None
+    _output.info("  [FAILED] %s: %s failed", provider.upper(), provider_args.command)
+    return provider, False, f"{provider_args.command} failed"
+
 
-    return None
+# Commands that can ask for input on a terminal (confirmation, proxytest cleanup)
+_PROMPTING_COMMANDS = ('cleanup', 'proxytest')
 
 
 def execute_all_providers(args):
@@ -67,80 +122,79 @@ def execute_all_providers(args):
     # All available providers (simplified list)
     providers = ['cloudflare', 'gcp', 'azure', 'alibaba']
 
-    # Get configured profiles
-    config = configparser.ConfigParser()
-    config_path = os.path.expanduser('~/.omniprox/profiles.ini')
-
-    if os.path.exists(config_path):
-        config.read(config_path)
+    # Get configured profiles (shared with the provider instances below)
+    config = load_profiles(Path.home() / '.omniprox' / 'profiles.ini')
+    if not config:
+        _output.info("\n[SKIP] No profiles configured")
+        return 0
 
     # Track results
     results = []
     successful = 0
     failed = 0
 
-    print("\n" + "="*60)
-    print(f"Executing '{args.command}' for all configured providers")
-    print("="*60)
+    _output.info("\n" + SEP)
+    _output.info("Executing '%s' for all configured providers", args.command)
+    _output.info(SEP)
 
+    jobs = []
     for provider in providers:
         # Use provider name directly as profile section
         profile_section = provider
 
         # Check if provider has a configured profile
         profile_name = f"{profile_section}:{args.profile}"
-        if profile_name not in config.sections():
+        if profile_name not in config:
             # Try default profile
             profile_name = f"{profile_section}:default"
 
-        if profile_name not in config.sections():
-            print(f"\n[SKIP] {provider.upper()}: No configuration found")
+        if profile_name not in config:
+            _output.info("\n[SKIP] %s: No configuration found", provider.upper())
             continue
 
-        print(f"\n[{provider.upper()}] Executing {args.command}...")
-        print("-" * 40)
-
-        # Create a copy of args with the current provider
-        provider_args = argparse.Namespace(**vars(args))
+        # Shallow copy per provider; each one runs in its own worker thread
+        provider_args = copy.copy(args)
         provider_args.provider = provider
+        provider_args.profile = profile_name.split(':', 1)[1]
         provider_args.all = False  # Prevent recursion
 
-        try:
-            # Get the provider class
-            provider_class = get_provider_class(provider)
-            if not provider_class:
-                print(f"  Error: Provider implementation not available")
-                failed += 1
-                continue
-
-            # Initialize and execute
-            provider_instance = provider_class(provider_args)
-            success = provider_instance.execute()
-
-            if success:
-                print(f"  [OK] {args.command} completed successfully")
-                successful += 1
-            else:
-                print(f"  [FAILED] {args.command} failed")
-                failed += 1
+        jobs.append((provider, provider_args))
+
+    # Prompts on a terminal need stdin to themselves, so run those commands one at a time
+    if args.command in _PROMPTING_COMMANDS and sys.stdin.isatty():
+        results = [_run_one(provider, provider_args) for provider, provider_args in jobs]
+    elif jobs:
+        # Provider commands are almost entirely network I/O against independent APIs
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = [executor.submit(_run_one, provider, provider_args)
+                       for provider, provider_args in jobs]
+            results = [future.result() for future in as_completed(futures)]
 
-        except Exception as e:
-            print(f"  Error: {e}")
+    errors = []
+    for provider, success, error in results:
+        if success:
+            successful += 1
+        else:
             failed += 1
+            errors.append((provider, error))
 
     # Summary
-    print("\n" + "="*60)
+    print("\n" + SEP)
     print("SUMMARY")
-    print("="*60)
+    print(SEP)
     print(f"Successful: {successful}")
     print(f"Failed: {failed}")
     print(f"Skipped: {len(providers) - successful - failed}")
+    for provider, error in errors:
+        print(f"  [FAILED] {provider.upper()}: {error}")
 
     return 0 if failed == 0 else 1
 
 
 def parse_arguments():
     """Parse command line arguments"""
+    from omniprox import __version__
+
     parser = argparse.ArgumentParser(
         prog='omniprox',
         description='OmniProx - Multi-cloud HTTP proxy manager',
@@ -161,6 +215,10 @@ Providers:
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
 
+    parser.add_argument('--version', '-v',
+                       action='version',
+                       version=f'%(prog)s {__version__}')
+
     parser.add_argument('--provider', '-p',
                        choices=['gcp', 'azure', 'az', 'cloudflare', 'cf', 'alibaba'],
                        help='Cloud provider')
@@ -215,23 +273,45 @@ Providers:
                        action='store_true',
                        help='Apply command to all configured providers (for cleanup/list commands)')
 
+    parser.add_argument('--refresh-auth',
+                       action='store_true',
+                       help='Ignore cached account details and credential checks and verify them again')
+
     return parser.parse_args()
 
 
+def _show_first_run_tip():
+    from omniprox.core.setup import check_first_run
+
+    if check_first_run():
+        print("Tip: Run 'omniprox --setup' for guided configuration")
+
+
 def main():
     """Main entry point for OmniProx"""
-    from omniprox.core.setup import check_first_run, OmniProxSetup
+    # Version and help output need nothing beyond argparse, so skip the setup module entirely
+    if any(arg in ('-v', '--version') for arg in sys.argv[1:]):
+        from omniprox import __version__
+        print(f"omniprox {__version__}")
+        return 0
+
+    if '--help' in sys.argv or '-h' in sys.argv:
+        parse_arguments()
 
     if '--setup' in sys.argv:
+        from omniprox.core.setup import OmniProxSetup
         setup = OmniProxSetup()
         setup.run_first_time_setup()
         return 0
 
-    if check_first_run() and '--help' not in sys.argv and '-h' not in sys.argv:
-        print("Tip: Run 'omniprox --setup' for guided configuration")
+    _show_first_run_tip()
 
     args = parse_arguments()
+    return run(args)
+
 
+def run(args):
+    """Run a command from a parsed argument namespace"""
     # Handle --all flag for cleanup/list commands
     if args.all:
         if args.command not in ['cleanup', 'list']:
@@ -248,10 +328,7 @@ def main():
             return 1
 
     # Handle provider aliases
-    if args.provider == 'cf':
-        args.provider = 'cloudflare'
-    elif args.provider == 'az':
-        args.provider = 'azure'
+    args.provider = _ALIASES.get(args.provider, args.provider)
 
     if args.check_providers:
         print_provider_status()
@@ -284,7 +361,7 @@ def main():
             print("  pip install google-cloud-api-gateway google-cloud-resource-manager")
         elif args.provider == 'azure':
             print("  pip install azure-mgmt-containerinstance azure-mgmt-resource azure-identity")
-        elif args.provider in ['cloudflare', 'cf']:
+        elif args.provider == 'cloudflare':
             print("  pip install requests")
 
         print("\nRun with --check-providers to see all provider statuses")
@@ -314,10 +391,72 @@ def main():
         if not args.quiet:
             print(f"\nError: {e}")
             if log_level == 'DEBUG':
+                import traceback
                 traceback.print_exc()
         sys.exit(1)
 
 
+# Namespace defaults matching parse_arguments(), used when the quick CLI skips argparse
+_QUICK_DEFAULTS = {
+    'provider': None,
+    'command': None,
+    'url': None,
+    'api_id': None,
+    'number': 1,
+    'region': None,
+    'profile': 'default',
+    'debug': False,
+    'quiet': False,
+    'log_level': None,
+    'log_file': None,
+    'check_providers': False,
+    'setup': False,
+    'all': False,
+    'refresh_auth': False,
+}
+
+_QUICK_COMMANDS = ('create', 'list', 'delete', 'update', 'cleanup', 'status', 'proxytest')
+
+
+def quick_dispatch(command: str, positional: list, flags: list) -> Optional[argparse.Namespace]:
+    """Build the argument namespace for a quick-CLI invocation without running argparse
+
+    Args:
+        command: Quick command name
+        positional: Positional arguments following the command
+        flags: Remaining option arguments
+
+    Returns:
+        Namespace, or None if the arguments need the full argparse parser
+    """
+    values = dict(_QUICK_DEFAULTS, command=command)
+
+    if positional:
+        if len(positional) > 1:
+            return None
+        # For create/update the positional is the URL, for delete it is the ID
+        if command in ('create', 'update'):
+            values['url'] = positional[0]
+        elif command == 'delete':
+            values['api_id'] = positional[0]
+        else:
+            return None
+
+    flags = list(flags)
+    while flags:
+        flag = flags.pop(0)
+        if flag in ('--provider', '-p') and flags and flags[0] in _ALIASES:
+            values['provider'] = flags.pop(0)
+        elif flag == '--profile' and flags:
+            values['profile'] = flags.pop(0)
+        elif flag in ('--debug', '-d'):
+            values['debug'] = True
+        else:
+            return None
+
+    return argparse.Namespace(**values)
+
+
 def quick_cli():
     """Quick CLI wrapper for common OmniProx operations (for 'omni' command)"""
 
@@ -349,12 +488,21 @@ Examples:
 For full options: omniprox --help""")
         sys.exit(0)
 
-    # Map simple commands to full syntax
+    # Common shapes go straight to run() without building the argparse parser
     args = sys.argv[1:]
+    if args[0] in _QUICK_COMMANDS:
+        rest = args[1:]
+        split = next((i for i, arg in enumerate(rest) if arg.startswith('-')), len(rest))
+        quick_args = quick_dispatch(args[0], rest[:split], rest[split:])
+        if quick_args is not None:
+            _show_first_run_tip()
+            return run(quick_args)
+
+    # Map simple commands to full syntax
     new_args = ['omniprox']
 
     # First argument is likely the command
-    if args[0] in ['create', 'list', 'delete', 'update', 'cleanup', 'status', 'proxytest']:
+    if args[0] in _QUICK_COMMANDS:
         new_args.extend(['--command', args[0]])
         args = args[1:]
 
@@ -4,22 +4,118 @@ Handles common functionality across all cloud providers
 """
 
 import configparser
-import datetime
+import functools
+import io
 import logging
 import random
+import re
 import string
-import time
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
-from urllib.parse import urlparse
+from typing import Dict, Any, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
 
-import tldextract
+from .fast_ini import parse_ini
+from .utils import get_output_logger, input_with_timeout, write_private_file
+
+# Separator lines for console output
+SEP = "=" * 60
+SUBSEP = "-" * 40
+
+# User-facing progress lines for proxytest
+_output = get_output_logger()
+
+# Parsed profiles.ini keyed by path, validated against (st_mtime_ns, st_size)
+_PROFILE_CACHE: Dict[str, Tuple[int, int, Dict[str, Dict[str, str]]]] = {}
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """Return (st_mtime_ns, st_size) for a file, or None if it does not exist"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_profiles(path: Path) -> Dict[str, Dict[str, str]]:
+    """Return the parsed profiles file, reusing the cached parse while the file is unchanged
+
+    Reads go through the lightweight fast_ini parser; ConfigParser is only
+    needed when a profile is written back to disk.
+
+    Args:
+        path: Path to profiles.ini
+
+    Returns:
+        dict: Section name to key/value mapping (empty if the file does not exist)
+    """
+    key = str(path)
+    stamp = _file_stamp(path)
+    if stamp is None:
+        _PROFILE_CACHE.pop(key, None)
+        return {}
+
+    cached = _PROFILE_CACHE.get(key)
+    if cached and cached[:2] == stamp:
+        return cached[2]
+
+    profiles = parse_ini(path)
+    _PROFILE_CACHE[key] = (stamp[0], stamp[1], profiles)
+    return profiles
+
+
+def invalidate_profiles(path: Path):
+    """Drop the cached parse of a profiles file after it has been rewritten"""
+    _PROFILE_CACHE.pop(str(path), None)
+
+
+def write_profiles(path: Path, config: configparser.ConfigParser):
+    """Write profiles back to disk and drop the cached parse
+
+    Writes beside the real file and renames over it, so a crash never leaves it half-written.
+
+    Args:
+        path: Path to profiles.ini
+        config: ConfigParser holding every profile to keep
+    """
+    text = io.StringIO()
+    config.write(text)
+    write_private_file(path, text.getvalue())
+    invalidate_profiles(path)
+
+
+_EXTRACTOR = None
+
+
+def _get_extractor():
+    """Build the shared TLD extractor on first use, from the bundled suffix list only"""
+    global _EXTRACTOR
+    if _EXTRACTOR is None:
+        import tldextract
+        _EXTRACTOR = tldextract.TLDExtract(suffix_list_urls=(), fallback_to_snapshot=True, cache_dir=None)
+    return _EXTRACTOR
+
+
+# Common http(s)://host form, accepted without a full urlsplit
+_HTTP_URL_RE = re.compile(r'^https?://[^\s/?#]+')
+
+
+@functools.lru_cache(maxsize=256)
+def _extract_domain(url: str) -> str:
+    return _get_extractor()(url).domain
 
 
 class BaseOmniProx(ABC):
     """Abstract base class for OmniProx providers"""
 
+    # Commands dispatched by execute() to the method of the same name
+    _COMMANDS = frozenset({
+        'create', 'list', 'delete', 'update', 'status', 'usage', 'cleanup', 'proxytest'
+    })
+
     def __init__(self, provider_name: str, args: Any):
         """Initialize base provider
 
@@ -39,29 +135,38 @@ class BaseOmniProx(ABC):
         self.api_id = getattr(args, 'api_id', None)
         self.auto_create = getattr(args, 'auto_create', False)
 
+        # Per-thread record of the last proxy created, used by proxytest
+        self._created = threading.local()
+
+        # Writable ConfigParser for profiles.ini and the file stamp it was read at
+        self._config = None
+        self._config_stamp = None
+
         # Load profile configuration
-        self.logger.debug(f"Loading profile '{self.profile}' for {self.provider}")
+        self.logger.debug("Loading profile '%s' for %s", self.profile, self.provider)
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
 
-        config = configparser.ConfigParser()
-        if self.config_path.exists():
-            config.read(self.config_path)
+        profiles = load_profiles(self.config_path)
 
         profile_name = f"{self.provider}:{self.profile}"
 
-        if profile_name not in config:
-            self.logger.info(f"Profile '{self.profile}' not found, creating new profile")
+        if profile_name not in profiles:
+            self.logger.info("Profile '%s' not found, creating new profile", self.profile)
             print(f"Creating new profile '{self.profile}' for {self.provider.upper()}...")
-            self.create_profile(config, profile_name)
+            # Full ConfigParser only for the write path, so save_profile keeps other sections intact
+            self.create_profile(self._writable_config(), profile_name)
         else:
-            self.logger.info(f"Loading existing profile '{self.profile}'")
+            self.logger.info("Loading existing profile '%s'", self.profile)
             print(f"Loading profile '{self.profile}' for {self.provider.upper()}...")
-            self.load_profile(config, profile_name)
+            self.load_profile(profiles, profile_name)
 
     @abstractmethod
     def create_profile(self, config: configparser.ConfigParser, profile_name: str):
         """Create a new provider profile configuration.
 
+        The config argument is already populated from profiles.ini; subclasses
+        must not call config.read() again, and should persist it with save_profile().
+
         Args:
             config: ConfigParser instance to store profile data
             profile_name: Name of the profile section
@@ -69,20 +174,33 @@ class BaseOmniProx(ABC):
         raise NotImplementedError("Subclass must implement create_profile")
 
     @abstractmethod
-    def load_profile(self, config: configparser.ConfigParser, profile_name: str):
+    def load_profile(self, config: Mapping[str, Mapping[str, str]], profile_name: str):
         """Load an existing provider profile configuration.
 
         Args:
-            config: ConfigParser instance containing profile data
+            config: Section mapping containing profile data (parsed dict or ConfigParser)
             profile_name: Name of the profile section to load
         """
         raise NotImplementedError("Subclass must implement load_profile")
 
+    def _writable_config(self) -> configparser.ConfigParser:
+        """Return a ConfigParser for profiles.ini, re-reading it only if the file changed
+
+        Subclasses that update their profile after construction should write
+        through this and save_profile() rather than reading the file themselves.
+        """
+        stamp = _file_stamp(self.config_path)
+        if self._config is None or stamp != self._config_stamp:
+            config = configparser.ConfigParser()
+            config.read(self.config_path)
+            self._config, self._config_stamp = config, stamp
+        return self._config
+
     def save_profile(self, config: configparser.ConfigParser):
-        self.logger.debug(f"Saving profile to {self.config_path}")
-        with open(self.config_path, 'w') as f:
-            config.write(f)
-        self.logger.info(f"Profile saved successfully")
+        self.logger.debug("Saving profile to %s", self.config_path)
+        write_profiles(self.config_path, config)
+        self._config, self._config_stamp = config, _file_stamp(self.config_path)
+        self.logger.info("Profile saved successfully")
 
     @abstractmethod
     def init_provider(self) -> bool:
@@ -95,29 +213,18 @@ class BaseOmniProx(ABC):
 
     def execute(self):
         """Execute the requested command"""
-        self.logger.info(f"Executing command: {self.command}")
-
-        command_map = {
-            'create': self.create,
-            'list': self.list,
-            'delete': self.delete,
-            'update': self.update,
-            'status': self.status,
-            'usage': self.usage,
-            'cleanup': self.cleanup,
-            'proxytest': self.proxytest
-        }
-
-        if self.command in command_map:
+        self.logger.info("Executing command: %s", self.command)
+
+        if self.command in self._COMMANDS:
             try:
-                result = command_map[self.command]()
-                self.logger.info(f"Command '{self.command}' completed successfully")
+                result = getattr(self, self.command)()
+                self.logger.info("Command '%s' completed successfully", self.command)
                 return result
             except Exception as e:
-                self.logger.error(f"Command '{self.command}' failed: {e}", exc_info=True)
+                self.logger.error("Command '%s' failed: %s", self.command, e, exc_info=True)
                 raise
         else:
-            self.logger.error(f"Unsupported command: {self.command}")
+            self.logger.error("Unsupported command: %s", self.command)
             print(f"Unsupported command for {self.provider}: {self.command}")
             return False
 
@@ -150,19 +257,19 @@ class BaseOmniProx(ABC):
 
     def update(self):
         """Update a proxy (optional)"""
-        self.logger.warning(f"Update command not implemented for {self.provider}")
+        self.logger.warning("Update command not implemented for %s", self.provider)
         print(f"Update command is not supported for {self.provider}")
         return False
 
     def status(self):
         """Check provider status (optional)"""
-        self.logger.warning(f"Status command not implemented for {self.provider}")
+        self.logger.warning("Status command not implemented for %s", self.provider)
         print(f"Status command is not supported for {self.provider}")
         return False
 
     def usage(self):
         """Check usage/billing information (optional)"""
-        self.logger.warning(f"Usage command not implemented for {self.provider}")
+        self.logger.warning("Usage command not implemented for %s", self.provider)
         print(f"Usage command is not supported for {self.provider}")
         return False
 
@@ -170,74 +277,78 @@ class BaseOmniProx(ABC):
         """Test proxy creation and IP rotation validation"""
         try:
             import requests
+            from requests.adapters import HTTPAdapter
         except ImportError:
             print("Error: 'requests' package required for proxy testing")
             print("Install with: pip install requests")
             return False
 
-        print(f"\n{'='*60}")
+        print(f"\n{SEP}")
         print(f"Proxy Test for {self.provider.upper()}")
-        print(f"{'='*60}")
+        print(SEP)
         print(f"Testing IP rotation with ipinfo.io/ip")
 
         test_url = "https://ipinfo.io/ip"
         test_count = 3
         created_proxies = []
+        original_url = self.url
 
         try:
-            # Create test proxies
-            print(f"\nStep 1: Creating {test_count} test proxies...")
-            original_url = self.url
-            self.url = test_url
+            # Initialise once up front so concurrent creates don't each bootstrap the provider
+            if not self.init_provider():
+                return False
 
-            for i in range(test_count):
-                print(f"  Creating proxy {i+1}/{test_count}...")
-
-                # Temporarily override create behavior for testing
-                if hasattr(self, '_create_single_proxy'):
-                    result = self._create_single_proxy()
-                else:
-                    result = self.create()
+            # Create test proxies concurrently; cloud create calls are independent and IO-bound
+            _output.info("\nStep 1: Creating %d test proxies...", test_count)
+            self.url = test_url
 
-                if result:
-                    # Try to get the created proxy URL - this is provider-specific
-                    proxy_url = self._get_last_created_proxy_url()
+            with ThreadPoolExecutor(max_workers=test_count) as executor:
+                futures = [executor.submit(self._create_test_proxy) for _ in range(test_count)]
+                for i, future in enumerate(futures):
+                    created, proxy_url = future.result()
                     if proxy_url:
                         created_proxies.append(proxy_url)
-                        print(f"    [OK] Created: {proxy_url}")
+                        _output.info("  [%d/%d] [OK] Created: %s", i + 1, test_count, proxy_url)
+                    elif created:
+                        _output.info("  [%d/%d] [WARNING] Created but couldn't get URL", i + 1, test_count)
                     else:
-                        print(f"    [WARNING] Created but couldn't get URL")
-                else:
-                    print(f"    [FAILED] Creation failed")
-
-                # Small delay between creations
-                time.sleep(2)
+                        _output.info("  [%d/%d] [FAILED] Creation failed", i + 1, test_count)
 
             # Test IP rotation
-            print(f"\nStep 2: Testing IP rotation...")
+            _output.info("\nStep 2: Testing IP rotation...")
             unique_ips = set()
 
-            for i, proxy_url in enumerate(created_proxies):
-                try:
-                    print(f"  Testing proxy {i+1}: {proxy_url}")
+            # One keep-alive session for all probes, sized so every worker gets a pooled connection
+            with requests.Session() as session:
+                adapter = HTTPAdapter(pool_connections=test_count, pool_maxsize=test_count)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
 
+                def probe(proxy_url):
                     # Make request through proxy
-                    response = requests.get(proxy_url, timeout=10)
+                    response = session.get(proxy_url, timeout=10)
                     if response.status_code == 200:
-                        ip = response.text.strip()
-                        unique_ips.add(ip)
-                        print(f"    [OK] IP: {ip}")
-                    else:
-                        print(f"    [WARNING] HTTP {response.status_code}")
-
-                except Exception as e:
-                    print(f"    [FAILED] Error: {e}")
-
-                time.sleep(1)
+                        return response.status_code, response.text.strip()
+                    return response.status_code, None
+
+                if created_proxies:
+                    with ThreadPoolExecutor(max_workers=len(created_proxies)) as executor:
+                        futures = [executor.submit(probe, proxy_url) for proxy_url in created_proxies]
+                        for i, (proxy_url, future) in enumerate(zip(created_proxies, futures)):
+                            _output.info("  Testing proxy %d: %s", i + 1, proxy_url)
+                            try:
+                                status_code, ip = future.result()
+                                if ip is not None:
+                                    unique_ips.add(ip)
+                                    _output.info("    [OK] IP: %s", ip)
+                                else:
+                                    _output.info("    [WARNING] HTTP %s", status_code)
+                            except Exception as e:
+                                _output.info("    [FAILED] Error: %s", e)
 
             # Results
             print(f"\nStep 3: Results Summary")
-            print(f"{'='*60}")
+            print(SEP)
             print(f"Proxies created: {len(created_proxies)}")
             print(f"Successful responses: {len(unique_ips)}")
             print(f"Unique IPs detected: {len(unique_ips)}")
@@ -251,10 +362,13 @@ class BaseOmniProx(ABC):
 
             print(f"\nDetected IPs: {', '.join(sorted(unique_ips))}")
 
-            # Cleanup
+            # Cleanup, without hanging unattended runs
             try:
-                cleanup_choice = input(f"\nCleanup test proxies? (y/n): ").strip().lower()
-                if cleanup_choice == 'y':
+                cleanup_choice = input_with_timeout("\nCleanup test proxies? (y/n): ", 30)
+                if cleanup_choice is None:
+                    print("No answer after 30s, keeping test proxies")
+                    print(f"Run 'omniprox --provider {self.provider} --command cleanup' to clean up manually")
+                elif cleanup_choice.strip().lower() == 'y':
                     print("Cleaning up test proxies...")
                     self.cleanup()
             except (EOFError, KeyboardInterrupt):
@@ -271,47 +385,78 @@ class BaseOmniProx(ABC):
             self.url = original_url
             return False
 
+    def _create_test_proxy(self):
+        """Create one proxy for proxytest
+
+        Runs in a worker thread; providers record the new URL with
+        _record_created_proxy_url so concurrent creates don't see each other's.
+
+        Returns:
+            tuple: (created, proxy_url) where proxy_url may be None
+        """
+        try:
+            if hasattr(self, '_create_single_proxy'):
+                result = self._create_single_proxy()
+            else:
+                result = self.create()
+        except Exception as e:
+            self.logger.error("Test proxy creation failed: %s", e)
+            return False, None
+
+        if not result:
+            return False, None
+        # Try to get the created proxy URL - this is provider-specific
+        return True, self._get_last_created_proxy_url()
+
+    def _record_created_proxy_url(self, url: str):
+        """Remember the URL of the proxy just created by the current thread"""
+        self._created.url = url
+
     def _get_last_created_proxy_url(self):
-        """Get the URL of the last created proxy (provider-specific implementation needed)"""
-        # This should be overridden by each provider
-        return None
+        """Get the URL of the last proxy created by the current thread"""
+        return getattr(self._created, 'url', None)
 
     def validate_url(self, url: str) -> bool:
         if not url:
             self.logger.error("URL is required but not provided")
             return False
 
+        if _HTTP_URL_RE.match(url):
+            return True
+
         try:
-            result = urlparse(url)
+            result = urlsplit(url)
             is_valid = all([result.scheme, result.netloc])
             if not is_valid:
-                self.logger.error(f"Invalid URL format: {url}")
+                self.logger.error("Invalid URL format: %s", url)
             return is_valid
         except Exception as e:
-            self.logger.error(f"Error validating URL {url}: {e}")
+            self.logger.error("Error validating URL %s: %s", url, e)
             return False
 
     def get_domain_from_url(self, url: str) -> str:
-        domain = tldextract.extract(url).domain
-        self.logger.debug(f"Extracted domain '{domain}' from URL '{url}'")
+        domain = _extract_domain(url)
+        self.logger.debug("Extracted domain '%s' from URL '%s'", domain, url)
         return domain
 
     def generate_api_id(self, url: str) -> str:
+        import datetime
+
         domain = self.get_domain_from_url(url)
         timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
         api_id = f'omniprox-{domain}-{timestamp}'
-        self.logger.debug(f"Generated API ID: {api_id}")
+        self.logger.debug("Generated API ID: %s", api_id)
         return api_id
 
     def print_success(self, operation: str, **kwargs):
-        self.logger.info(f"Success: {operation}")
+        self.logger.info("Success: %s", operation)
         print(f"\nSuccessfully {operation}!")
         for key, value in kwargs.items():
             if value:
                 print(f"  {key.replace('_', ' ').title()}: {value}")
 
     def print_error(self, operation: str, error: str):
-        self.logger.error(f"Failed: {operation} - {error}")
+        self.logger.error("Failed: %s - %s", operation, error)
         print(f"\nError {operation}: {error}")
 
     def require_api_id(self) -> bool:
@@ -0,0 +1,77 @@
+"""
+Minimal INI reader for profiles.ini
+Covers the subset of the format written by configparser, without its parsing overhead
+"""
+
+import configparser
+import re
+from pathlib import Path
+from typing import Dict
+
+_SECTION_RE = re.compile(r'\[([^\]]+)\][ \t]*$')
+_KV_RE = re.compile(r'([^=\s;#\[][^=]*?)[ \t]*=[ \t]*(.*?)[ \t]*$')
+
+
+def _parse_with_configparser(text: str) -> Dict[str, Dict[str, str]]:
+    """Parse INI text with configparser, for files outside the fast subset"""
+    config = configparser.ConfigParser()
+    config.read_string(text)
+    return {name: dict(config[name]) for name in config.sections()}
+
+
+def parse_ini_text(text: str) -> Dict[str, Dict[str, str]]:
+    """Parse INI text into a dict of sections
+
+    Keys are lower-cased and values stripped, matching configparser's defaults.
+    Values from a [DEFAULT] section are inherited by every other section.
+    Files using anything outside that subset (`key: value` lines, multi-line
+    values, % interpolation) are handed to configparser, so hand-edited
+    profiles read the same as they always did.
+
+    Args:
+        text: INI file contents
+
+    Returns:
+        dict: Section name to key/value mapping
+    """
+    sections = {}
+    section = None
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped[0] in '#;':
+            continue
+        # Continuation lines and interpolation need configparser
+        if line[0] in ' \t' or '%' in line:
+            return _parse_with_configparser(text)
+
+        match = _SECTION_RE.match(line)
+        if match:
+            section = sections.setdefault(match.group(1).strip(), {})
+            continue
+
+        match = _KV_RE.match(line)
+        # ':' is also a delimiter for configparser, and it splits on whichever comes first
+        if match is None or section is None or ':' in match.group(1):
+            return _parse_with_configparser(text)
+        section[match.group(1).strip().lower()] = match.group(2)
+
+    defaults = sections.pop('DEFAULT', None)
+    if defaults:
+        for name, values in sections.items():
+            sections[name] = {**defaults, **values}
+
+    return sections
+
+
+def parse_ini(path: Path) -> Dict[str, Dict[str, str]]:
+    """Parse an INI file into a dict of sections
+
+    Args:
+        path: Path to the INI file
+
+    Returns:
+        dict: Section name to key/value mapping
+    """
+    with open(path, 'r') as f:
+        return parse_ini_text(f.read())
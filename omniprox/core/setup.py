@@ -3,29 +3,94 @@ OmniProx First-Time Setup Module
 Handles initial configuration and project creation for all cloud providers
 """
 
+import functools
 import os
 import sys
-import subprocess
-import configparser
-import json
 from pathlib import Path
-from datetime import datetime
-import logging
-import getpass
+from typing import TYPE_CHECKING
+
+# Everything else is imported where used: the CLI imports this module on every
+# run for check_first_run(), while the wizard itself only runs with --setup
+if TYPE_CHECKING:
+    import subprocess
+
+
+# CLI identity checks, keyed by probe name
+_CLI_PROBES = {
+    'azure': ['az', 'account', 'show'],
+    'gcloud': ['gcloud', 'auth', 'list'],
+}
+
+# Setup targets that may need each probe
+_PROVIDER_PROBES = {
+    'azure': 'azure',
+    'azure_frontdoor': 'azure',
+    'gcp': 'gcloud',
+    'gcp_loadbalancer': 'gcloud',
+}
+
+
+def _run_cli_probe(name: str) -> 'subprocess.CompletedProcess':
+    import subprocess
+
+    return subprocess.run(_CLI_PROBES[name], capture_output=True, text=True, check=False, timeout=30)
 
 
 class OmniProxSetup:
     """First-time setup wizard for OmniProx"""
 
+    def _start_cli_probes(self, providers: list):
+        """Start the az/gcloud identity checks in the background
+
+        Cold CLI startup takes seconds, so the checks run while the user is
+        answering prompts and are collected by _cli_probe() when needed.
+        """
+        names = {_PROVIDER_PROBES[p] for p in providers if p in _PROVIDER_PROBES}
+        if not names:
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        executor = ThreadPoolExecutor(max_workers=len(names))
+        self._cli_probes = {name: executor.submit(_run_cli_probe, name) for name in names}
+        executor.shutdown(wait=False)
+
+    def _cli_probe(self, name: str) -> 'subprocess.CompletedProcess':
+        """Return a CLI probe's result, running it now if it was not started in the background"""
+        future = self._cli_probes.get(name)
+        if future is None:
+            return _run_cli_probe(name)
+        return future.result()
+
+    def _check_gcloud_cli(self) -> dict:
+        """Check gcloud CLI authentication.
+
+        Returns:
+            dict with 'success' and 'error' (if failed)
+        """
+        import subprocess
+
+        try:
+            result = self._cli_probe('gcloud')
+            if result.returncode == 0 and 'ACTIVE' in result.stdout:
+                return {'success': True}
+            return {'success': False, 'error': "GCloud CLI not authenticated. Run 'gcloud auth login' first."}
+        except FileNotFoundError:
+            return {'success': False, 'error': "GCloud CLI not installed. Please install it first."}
+        except subprocess.TimeoutExpired:
+            return {'success': False, 'error': "GCloud CLI check timed out."}
+
     def _check_azure_cli(self) -> dict:
         """Check Azure CLI authentication and return account info.
 
         Returns:
             dict with 'success', 'account' (if success), and 'error' (if failed)
         """
+        import json
+        import subprocess
+
         try:
-            result = subprocess.run(['az', 'account', 'show'],
-                                  capture_output=True, text=True, check=False, timeout=30)
+            result = self._cli_probe('azure')
             if result.returncode == 0:
                 account = json.loads(result.stdout)
                 return {'success': True, 'account': account}
@@ -36,23 +101,84 @@ class OmniProxSetup:
         except subprocess.TimeoutExpired:
             return {'success': False, 'error': "Azure CLI check timed out."}
 
-    def _get_azure_service_principal(self) -> dict:
+    def _get_azure_service_principal(self, section: str) -> dict:
         """Collect Azure service principal credentials from user.
 
+        Args:
+            section: Setup section the answers belong to
+
         Returns:
             dict with subscription_id, tenant_id, client_id, client_secret
         """
-        return {
-            'subscription_id': input("Azure Subscription ID: ").strip(),
-            'tenant_id': input("Tenant ID: ").strip(),
-            'client_id': input("Client ID (App ID): ").strip(),
-            'client_secret': getpass.getpass("Client Secret: ").strip()
-        }
+        return self._prompt_batch(section, [
+            ('subscription_id', "Azure Subscription ID: ", ''),
+            ('tenant_id', "Tenant ID: ", ''),
+            ('client_id', "Client ID (App ID): ", ''),
+            ('client_secret', "Client Secret: ", '', True),
+        ])
 
     def __init__(self):
         """Initialize setup wizard"""
         self.config_dir = Path.home() / '.omniprox'
         self.profiles_file = self.config_dir / 'profiles.ini'
+        self._cli_probes = {}
+
+        # Pre-filled answers for scripted setup, keyed by section
+        preset = os.environ.get('OMNIPROX_SETUP_JSON')
+        self._preset = self._parse_preset(preset) if preset else None
+
+    @staticmethod
+    def _parse_preset(text: str) -> dict:
+        """Parse OMNIPROX_SETUP_JSON, exiting with a message if it is unusable
+
+        Args:
+            text: The variable's value
+
+        Returns:
+            dict of section to answers
+        """
+        import json
+        try:
+            preset = json.loads(text)
+        except ValueError as e:
+            sys.exit(f"Error: OMNIPROX_SETUP_JSON is not valid JSON: {e}")
+        if not isinstance(preset, dict):
+            sys.exit("Error: OMNIPROX_SETUP_JSON must be a JSON object of sections, "
+                     "e.g. {\"cloudflare\": {\"api_token\": \"...\"}}")
+        for section, answers in preset.items():
+            if not isinstance(answers, dict):
+                sys.exit(f"Error: OMNIPROX_SETUP_JSON section '{section}' must be a JSON object of answers")
+        return preset
+
+    def _prompt_batch(self, section: str, specs: list) -> dict:
+        """Ask a group of setup questions
+
+        Each spec is (key, prompt, default) or (key, prompt, default, secret);
+        blank answers take the default and secret answers are read with getpass.
+        When OMNIPROX_SETUP_JSON is set, answers come from its object for
+        `section` instead and nothing is prompted, so setup can be scripted.
+
+        Args:
+            section: Setup section the answers belong to (e.g. 'azure')
+            specs: Questions to ask, in order
+
+        Returns:
+            dict of key to answer
+        """
+        preset = None if self._preset is None else self._preset.get(section, {})
+        answers = {}
+        for key, prompt, default, *secret in specs:
+            if preset is not None:
+                # null is the same as leaving the answer out
+                value = preset.get(key)
+                value = '' if value is None else str(value)
+            elif secret and secret[0]:
+                import getpass
+                value = getpass.getpass(prompt)
+            else:
+                value = input(prompt)
+            answers[key] = value.strip() or default
+        return answers
 
     def run_first_time_setup(self):
         """Run the interactive setup wizard"""
@@ -73,7 +199,9 @@ class OmniProxSetup:
 
         if self.profiles_file.exists():
             print(f"[OK] Found existing configuration at {self.profiles_file}")
-            response = input("\nWould you like to add more provider profiles? (y/n): ").strip().lower()
+            response = self._prompt_batch('setup', [
+                ('add_more', "\nWould you like to add more provider profiles? (y/n): ", ''),
+            ])['add_more'].lower()
             if response != 'y':
                 print("Setup cancelled.")
                 return False
@@ -93,7 +221,7 @@ class OmniProxSetup:
         print("  7. All providers")
         print("  8. Skip setup")
 
-        choice = input("\nSelect option (1-8): ").strip()
+        choice = self._prompt_batch('setup', [('option', "\nSelect option (1-8): ", '')])['option']
 
         providers = []
         if choice == '1':
@@ -117,6 +245,10 @@ class OmniProxSetup:
             print("Invalid choice. Setup cancelled.")
             return False
 
+        self._start_cli_probes(providers)
+
+        import configparser
+
         config = configparser.ConfigParser()
         if self.profiles_file.exists():
             config.read(self.profiles_file)
@@ -139,8 +271,8 @@ class OmniProxSetup:
             elif provider == 'alibaba':
                 self._setup_alibaba(config)
 
-        with open(self.profiles_file, 'w') as f:
-            config.write(f)
+        from .base import write_profiles
+        write_profiles(self.profiles_file, config)
 
         print("\n" + "="*60)
         print(" Setup Complete!")
@@ -160,9 +292,11 @@ class OmniProxSetup:
         print("  2. Enter service principal manually")
         print("  3. Skip for now")
 
-        choice = input("\nSelect option (1-3): ").strip()
-
-        profile_name = input("Profile name (default: 'default'): ").strip() or 'default'
+        answers = self._prompt_batch('azure', [
+            ('option', "\nSelect option (1-3): ", ''),
+            ('profile', "Profile name (default: 'default'): ", 'default'),
+        ])
+        choice, profile_name = answers['option'], answers['profile']
         profile_key = f"azure:{profile_name}"
 
         if profile_key not in config:
@@ -182,13 +316,15 @@ class OmniProxSetup:
                 return
 
         elif choice == '2':
-            creds = self._get_azure_service_principal()
+            creds = self._get_azure_service_principal('azure')
             config[profile_key].update(creds)
 
         elif choice == '3':
             print("[OK] Will use Azure CLI credentials when available")
 
-        config[profile_key]['location'] = input("Azure Location (default: eastus): ").strip() or 'eastus'
+        config[profile_key].update(self._prompt_batch('azure', [
+            ('location', "Azure Location (default: eastus): ", 'eastus'),
+        ]))
         config[profile_key]['resource_group'] = ''
         config[profile_key]['service_name'] = ''
         print(f"[OK] Azure profile '{profile_name}' configured")
@@ -200,36 +336,37 @@ class OmniProxSetup:
         print("  2. Enter service account path manually")
         print("  3. Skip for now")
 
-        choice = input("\nSelect option (1-3): ").strip()
-
-        profile_name = input("Profile name (default: 'default'): ").strip() or 'default'
+        answers = self._prompt_batch('gcp', [
+            ('option', "\nSelect option (1-3): ", ''),
+            ('profile', "Profile name (default: 'default'): ", 'default'),
+        ])
+        choice, profile_name = answers['option'], answers['profile']
         profile_key = f"gcp:{profile_name}"
 
         if profile_key not in config:
             config[profile_key] = {}
 
         if choice == '1':
-            try:
-                result = subprocess.run(['gcloud', 'auth', 'list'],
-                                      capture_output=True, text=True, check=False, timeout=30)
-                if result.returncode == 0 and 'ACTIVE' in result.stdout:
-                    print(f"[OK] GCloud CLI configured")
-                    config[profile_key]['use_cli'] = 'true'
-                else:
-                    print("GCloud CLI not authenticated. Run 'gcloud auth login' first.")
-                    return
-            except FileNotFoundError:
-                print("GCloud CLI not installed. Please install it first.")
+            cli_result = self._check_gcloud_cli()
+            if cli_result['success']:
+                print(f"[OK] GCloud CLI configured")
+                config[profile_key]['use_cli'] = 'true'
+            else:
+                print(cli_result['error'])
                 return
 
         elif choice == '2':
-            config[profile_key]['credentials_path'] = input("Service Account JSON path: ").strip()
+            config[profile_key].update(self._prompt_batch('gcp', [
+                ('credentials_path', "Service Account JSON path: ", ''),
+            ]))
 
         elif choice == '3':
             print("[OK] Will use gcloud CLI credentials when available")
 
-        config[profile_key]['project_id'] = input("GCP Project ID: ").strip()
-        config[profile_key]['region'] = input("Region (default: us-central1): ").strip() or 'us-central1'
+        config[profile_key].update(self._prompt_batch('gcp', [
+            ('project_id', "GCP Project ID: ", ''),
+            ('region', "Region (default: us-central1): ", 'us-central1'),
+        ]))
         print(f"[OK] GCP profile '{profile_name}' configured")
 
     def _setup_cloudflare(self, config):
@@ -242,15 +379,19 @@ class OmniProxSetup:
         print("4. Copy the token and your Account ID from the dashboard")
         print()
 
-        profile_name = input("Profile name (default: 'default'): ").strip() or 'default'
+        answers = self._prompt_batch('cloudflare', [
+            ('profile', "Profile name (default: 'default'): ", 'default'),
+            ('api_token', "Cloudflare API Token: ", '', True),
+            ('account_id', "Cloudflare Account ID: ", ''),
+            ('zone_id', "Cloudflare Zone ID (optional): ", ''),
+        ])
+        profile_name = answers.pop('profile')
         profile_key = f"cloudflare:{profile_name}"
 
         if profile_key not in config:
             config[profile_key] = {}
 
-        config[profile_key]['api_token'] = getpass.getpass("Cloudflare API Token: ").strip()
-        config[profile_key]['account_id'] = input("Cloudflare Account ID: ").strip()
-        config[profile_key]['zone_id'] = input("Cloudflare Zone ID (optional): ").strip() or ''
+        config[profile_key].update(answers)
 
         print(f"[OK] Cloudflare profile '{profile_name}' configured")
 
@@ -263,9 +404,11 @@ class OmniProxSetup:
         print("  2. Enter service principal credentials")
         print("  3. Skip for now")
 
-        choice = input("\nSelect option (1-3): ").strip()
-
-        profile_name = input("Profile name (default: 'default'): ").strip() or 'default'
+        answers = self._prompt_batch('azure_frontdoor', [
+            ('option', "\nSelect option (1-3): ", ''),
+            ('profile', "Profile name (default: 'default'): ", 'default'),
+        ])
+        choice, profile_name = answers['option'], answers['profile']
         profile_key = f"azure_frontdoor:{profile_name}"
 
         if profile_key not in config:
@@ -284,10 +427,12 @@ class OmniProxSetup:
                 return
 
         elif choice == '2':
-            creds = self._get_azure_service_principal()
+            creds = self._get_azure_service_principal('azure_frontdoor')
             config[profile_key].update(creds)
 
-        config[profile_key]['resource_group'] = input("Resource Group Name (default: omniprox-frontdoor): ").strip() or 'omniprox-frontdoor'
+        config[profile_key].update(self._prompt_batch('azure_frontdoor', [
+            ('resource_group', "Resource Group Name (default: omniprox-frontdoor): ", 'omniprox-frontdoor'),
+        ]))
         print(f"[OK] Azure Front Door profile '{profile_name}' configured")
 
     def _setup_gcp_loadbalancer(self, config):
@@ -299,35 +444,36 @@ class OmniProxSetup:
         print("  2. Enter service account path manually")
         print("  3. Skip for now")
 
-        choice = input("\nSelect option (1-3): ").strip()
-
-        profile_name = input("Profile name (default: 'default'): ").strip() or 'default'
+        answers = self._prompt_batch('gcp_loadbalancer', [
+            ('option', "\nSelect option (1-3): ", ''),
+            ('profile', "Profile name (default: 'default'): ", 'default'),
+        ])
+        choice, profile_name = answers['option'], answers['profile']
         profile_key = f"gcp_loadbalancer:{profile_name}"
 
         if profile_key not in config:
             config[profile_key] = {}
 
         if choice == '1':
-            try:
-                result = subprocess.run(['gcloud', 'auth', 'list'],
-                                      capture_output=True, text=True, check=False, timeout=30)
-                if result.returncode == 0 and 'ACTIVE' in result.stdout:
-                    print(f"[OK] GCloud CLI configured")
-                    config[profile_key]['use_cli'] = 'true'
-                else:
-                    print("GCloud CLI not authenticated. Run 'gcloud auth login' first.")
-                    return
-            except FileNotFoundError:
-                print("GCloud CLI not installed. Please install it first.")
+            cli_result = self._check_gcloud_cli()
+            if cli_result['success']:
+                print(f"[OK] GCloud CLI configured")
+                config[profile_key]['use_cli'] = 'true'
+            else:
+                print(cli_result['error'])
                 return
 
         elif choice == '2':
-            config[profile_key]['service_account_key'] = input("Service Account JSON path: ").strip()
+            config[profile_key].update(self._prompt_batch('gcp_loadbalancer', [
+                ('service_account_key', "Service Account JSON path: ", ''),
+            ]))
             config[profile_key]['use_cli'] = 'false'
 
-        config[profile_key]['project_id'] = input("GCP Project ID: ").strip()
-        config[profile_key]['region'] = input("Region (default: us-central1): ").strip() or 'us-central1'
-        config[profile_key]['zone'] = input("Zone (default: us-central1-a): ").strip() or 'us-central1-a'
+        config[profile_key].update(self._prompt_batch('gcp_loadbalancer', [
+            ('project_id', "GCP Project ID: ", ''),
+            ('region', "Region (default: us-central1): ", 'us-central1'),
+            ('zone', "Zone (default: us-central1-a): ", 'us-central1-a'),
+        ]))
         print(f"[OK] GCP Load Balancer profile '{profile_name}' configured")
 
     def _setup_alibaba(self, config):
@@ -340,21 +486,26 @@ class OmniProxSetup:
         print("3. Copy your Access Key ID and Access Key Secret")
         print()
 
-        profile_name = input("Profile name (default: 'default'): ").strip() or 'default'
+        answers = self._prompt_batch('alibaba', [
+            ('profile', "Profile name (default: 'default'): ", 'default'),
+            ('access_key_id', "Access Key ID: ", ''),
+            ('access_key_secret', "Access Key Secret: ", '', True),
+            ('region_id', "Region ID (default: cn-hangzhou): ", 'cn-hangzhou'),
+        ])
+        profile_name = answers.pop('profile')
         profile_key = f"alibaba:{profile_name}"
 
         if profile_key not in config:
             config[profile_key] = {}
 
-        config[profile_key]['access_key_id'] = input("Access Key ID: ").strip()
-        config[profile_key]['access_key_secret'] = getpass.getpass("Access Key Secret: ").strip()
-        config[profile_key]['region_id'] = input("Region ID (default: cn-hangzhou): ").strip() or 'cn-hangzhou'
+        config[profile_key].update(answers)
 
         print(f"[OK] Alibaba Cloud profile '{profile_name}' configured")
 
 
+@functools.lru_cache(maxsize=None)
 def check_first_run():
-    """Check if this is the first time running OmniProx"""
+    """Check if this is the first time running OmniProx (evaluated once per process)"""
     config_dir = Path.home() / '.omniprox'
     profiles_file = config_dir / 'profiles.ini'
 
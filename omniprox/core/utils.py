@@ -2,51 +2,62 @@
 Utility functions for OmniProx
 """
 
+import functools
+import importlib.util
 import logging
 import logging.handlers
-import random
-import string
+import os
+import queue
+import secrets
+import select
 import sys
+import tempfile
+import threading
 from pathlib import Path
 from typing import Optional
 
 
+_CONSOLE_FORMAT = '%(asctime)s - %(levelname)s - %(name)s - %(message)s'
+
+
+class _ColoredFormatter(logging.Formatter):
+    COLORS = {
+        'DEBUG': '\033[36m',
+        'INFO': '\033[32m',
+        'WARNING': '\033[33m',
+        'ERROR': '\033[31m',
+        'CRITICAL': '\033[35m',
+        'RESET': '\033[0m'
+    }
+
+    def format(self, record):
+        levelname = record.levelname
+        log_color = self.COLORS.get(levelname, self.COLORS['RESET'])
+        record.levelname = f"{log_color}{levelname}{self.COLORS['RESET']}"
+        try:
+            return super().format(record)
+        finally:
+            # Other handlers (e.g. the log file) see the record after us
+            record.levelname = levelname
+
+
+@functools.lru_cache(maxsize=None)
+def _console_formatter(colored: bool) -> logging.Formatter:
+    if colored:
+        return _ColoredFormatter(_CONSOLE_FORMAT, datefmt='%H:%M:%S')
+    return logging.Formatter(_CONSOLE_FORMAT, datefmt='%Y-%m-%d %H:%M:%S')
+
+
 def setup_logging(level: str = 'INFO', log_file: Optional[str] = None) -> logging.Logger:
     logger = logging.getLogger('omniprox')
-    logger.setLevel(getattr(logging, level.upper()))
+    log_level = getattr(logging, level.upper())
+    logger.setLevel(log_level)
 
     logger.handlers = []
 
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, level.upper()))
-
-    if sys.stdout.isatty():
-        class ColoredFormatter(logging.Formatter):
-            COLORS = {
-                'DEBUG': '\033[36m',
-                'INFO': '\033[32m',
-                'WARNING': '\033[33m',
-                'ERROR': '\033[31m',
-                'CRITICAL': '\033[35m',
-                'RESET': '\033[0m'
-            }
-
-            def format(self, record):
-                log_color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
-                record.levelname = f"{log_color}{record.levelname}{self.COLORS['RESET']}"
-                return super().format(record)
-
-        console_formatter = ColoredFormatter(
-            '%(asctime)s - %(levelname)s - %(name)s - %(message)s',
-            datefmt='%H:%M:%S'
-        )
-    else:
-        console_formatter = logging.Formatter(
-            '%(asctime)s - %(levelname)s - %(name)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-
-    console_handler.setFormatter(console_formatter)
+    console_handler.setLevel(log_level)
+    console_handler.setFormatter(_console_formatter(sys.stdout.isatty()))
     logger.addHandler(console_handler)
 
     if log_file:
@@ -69,56 +80,90 @@ def setup_logging(level: str = 'INFO', log_file: Optional[str] = None) -> loggin
     return logger
 
 
-def check_provider_availability(provider: str) -> bool:
-    availability = {
-        'gcp': check_gcp_availability,
-        'azure': check_azure_availability,
-        'az': check_azure_availability,
-        'cloudflare': check_cloudflare_availability,
-        'cf': check_cloudflare_availability,
-        'azure-fd': check_azure_availability,
-        'azure-frontdoor': check_azure_availability,
-        'gcp-lb': check_gcp_availability,
-        'gcp-loadbalancer': check_gcp_availability,
-        'alibaba': check_alibaba_availability,
-        'aliyun': check_alibaba_availability
-    }
+class _StdoutHandler(logging.Handler):
+    """Handler that writes to whatever sys.stdout is when the record is emitted"""
+
+    def emit(self, record):
+        try:
+            sys.stdout.write(self.format(record) + '\n')
+        except Exception:
+            self.handleError(record)
 
-    checker = availability.get(provider.lower())
-    if checker:
-        return checker()
+
+def get_output_logger() -> logging.Logger:
+    """Logger for user-facing progress lines, written to stdout as plain text"""
+    logger = logging.getLogger('omniprox.output')
+    if not logger.handlers:
+        handler = _StdoutHandler()
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
+
+# Accepted provider names and aliases -> base provider whose dependencies they share
+_PROVIDER_BASES = {
+    'gcp': 'gcp',
+    'gcp-lb': 'gcp',
+    'gcp-loadbalancer': 'gcp',
+    'azure': 'azure',
+    'az': 'azure',
+    'azure-fd': 'azure',
+    'azure-frontdoor': 'azure',
+    'cloudflare': 'cloudflare',
+    'cf': 'cloudflare',
+    'alibaba': 'alibaba',
+    'aliyun': 'alibaba',
+}
+
+# Provider variants reported by get_available_providers/print_provider_status, per base provider
+_PROVIDER_VARIANTS = {
+    'cloudflare': ('cloudflare',),
+    'gcp': ('gcp', 'gcp-lb'),
+    'azure': ('azure', 'azure-fd'),
+    'alibaba': ('alibaba',),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def check_provider_availability(provider: str) -> bool:
+    base = _PROVIDER_BASES.get(provider.lower())
+    if base:
+        return _AVAILABILITY_CHECKS[base]()
     return False
 
 
-def check_gcp_availability() -> bool:
-    """Check if GCP dependencies are available"""
+def _modules_available(*names: str) -> bool:
+    """Check modules can be imported without executing them
+
+    find_spec still imports parent packages, which fails if they are missing.
+    """
     try:
-        import google.cloud.apigateway_v1
-        return True
-    except ImportError:
+        return all(importlib.util.find_spec(name) is not None for name in names)
+    except (ImportError, ValueError):
         return False
 
 
+@functools.lru_cache(maxsize=None)
+def check_gcp_availability() -> bool:
+    """Check if GCP dependencies are available"""
+    return _modules_available('google.cloud.apigateway_v1')
+
+
+@functools.lru_cache(maxsize=None)
 def check_cloudflare_availability() -> bool:
     """Check if Cloudflare dependencies are available"""
-    try:
-        import requests
-        return True
-    except ImportError:
-        return False
+    return _modules_available('requests')
 
 
+@functools.lru_cache(maxsize=None)
 def check_azure_availability() -> bool:
     """Check if Azure dependencies are available"""
-    try:
-        import azure.mgmt.containerinstance
-        import azure.mgmt.resource
-        import azure.identity
-        return True
-    except ImportError:
-        return False
+    return _modules_available('azure.mgmt.containerinstance', 'azure.mgmt.resource', 'azure.identity')
 
 
+@functools.lru_cache(maxsize=None)
 def check_alibaba_availability() -> bool:
     """Check if Alibaba Cloud dependencies are available"""
     # For now, return True as Alibaba SDK is optional
@@ -126,39 +171,39 @@ def check_alibaba_availability() -> bool:
     return True
 
 
+# Dependency check for each base provider
+_AVAILABILITY_CHECKS = {
+    'cloudflare': check_cloudflare_availability,
+    'gcp': check_gcp_availability,
+    'azure': check_azure_availability,
+    'alibaba': check_alibaba_availability,
+}
+
+
+def _capabilities() -> dict:
+    """Availability of each base provider's dependencies"""
+    return {base: check() for base, check in _AVAILABILITY_CHECKS.items()}
+
+
 def get_available_providers() -> list:
-    providers = []
-    if check_gcp_availability():
-        providers.append('gcp')
-        providers.append('gcp-lb')  # Same dependencies as GCP
-    if check_azure_availability():
-        providers.append('azure')
-        providers.append('azure-fd')  # Same base dependencies as Azure
-    if check_cloudflare_availability():
-        providers.append('cloudflare')
-    if check_alibaba_availability():
-        providers.append('alibaba')
-    return providers
+    capabilities = _capabilities()
+    return [variant
+            for base, variants in _PROVIDER_VARIANTS.items() if capabilities[base]
+            for variant in variants]
 
 
 def print_provider_status():
     """Print the status of all available providers"""
-    providers = {
-        'cloudflare': check_cloudflare_availability(),
-        'gcp': check_gcp_availability(),
-        'gcp-lb': check_gcp_availability(),
-        'azure': check_azure_availability(),
-        'azure-fd': check_azure_availability(),
-        'alibaba': check_alibaba_availability()
-    }
+    capabilities = _capabilities()
 
     print("\nProvider Availability Status:")
     print("-" * 40)
 
-    for provider, available in providers.items():
-        status = "[OK]" if available else "[X]"
-        provider_display = provider.upper().replace('-', ' ')
-        print(f"{status} {provider_display}")
+    for base, variants in _PROVIDER_VARIANTS.items():
+        status = "[OK]" if capabilities[base] else "[X]"
+        for provider in variants:
+            provider_display = provider.upper().replace('-', ' ')
+            print(f"{status} {provider_display}")
 
     print()
 
@@ -172,9 +217,7 @@ def normalize_url(url: str) -> str:
     Returns:
         str: Normalized URL
     """
-    if url and url.endswith('/'):
-        return url.rstrip('/')
-    return url
+    return url.rstrip('/') if url else url
 
 
 def format_timestamp(dt) -> str:
@@ -199,9 +242,9 @@ def truncate_text(text: str, max_length: int = 50) -> str:
     Returns:
         str: Truncated string
     """
-    if len(text) > max_length:
-        return text[:max_length-3] + '...'
-    return text
+    if len(text) <= max_length:
+        return text
+    return f"{text[:max_length-3]}..."
 
 
 def get_unique_suffix(length: int = 6) -> str:
@@ -211,9 +254,25 @@ def get_unique_suffix(length: int = 6) -> str:
         length: Length of the suffix
 
     Returns:
-        str: Random lowercase alphanumeric string
+        str: Random lowercase hex string
     """
-    return ''.join(random.choices(string.ascii_lowercase + string.digits, k=length))
+    return secrets.token_hex((length + 1) // 2)[:length]
+
+
+def write_private_file(path: Path, text: str) -> None:
+    """Atomically replace path with text, readable only by the current user
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
 
 def confirm_action(prompt: str, auto_confirm_non_interactive: bool = True) -> bool:
@@ -239,3 +298,61 @@ def confirm_action(prompt: str, auto_confirm_non_interactive: bool = True) -> bo
     except (EOFError, KeyboardInterrupt):
         print("\nOperation cancelled")
         return False
+
+
+# Lines read from stdin by the fallback reader thread in input_with_timeout()
+_stdin_lines = queue.Queue()
+_stdin_reader = None
+
+
+def _read_line_threaded(timeout: float) -> Optional[str]:
+    """Read a line from stdin on a reader thread, or None after timeout seconds
+
+    The thread cannot be cancelled, so after a timeout it is left waiting and
+    the next call collects its line rather than starting a second reader.
+    """
+    global _stdin_reader
+    if _stdin_lines.empty() and (_stdin_reader is None or not _stdin_reader.is_alive()):
+        _stdin_reader = threading.Thread(target=lambda: _stdin_lines.put(sys.stdin.readline()), daemon=True)
+        _stdin_reader.start()
+    try:
+        return _stdin_lines.get(timeout=timeout)
+    except queue.Empty:
+        return None
+
+
+def input_with_timeout(prompt: str, timeout: float) -> Optional[str]:
+    """Like input(), but give up after timeout seconds
+
+    As with input(), a line typed after a timeout answers the next prompt.
+    Where stdin can't be polled (Windows, or not a real file) a reader thread
+    waits on it instead, and stays blocked until a line arrives, so don't mix
+    plain input() calls with this one there.
+
+    Args:
+        prompt: The prompt to display
+        timeout: Seconds to wait for a line
+
+    Returns:
+        Optional[str]: The line without its newline, or None on timeout
+
+    Raises:
+        EOFError: If stdin is at end of file
+    """
+    print(prompt, end='', flush=True)
+
+    try:
+        if os.name == 'nt':
+            raise OSError("select() only supports sockets on Windows")
+        ready, _, _ = select.select([sys.stdin], [], [], timeout)
+        line = sys.stdin.readline() if ready else None
+    except (OSError, ValueError):
+        # No selectable stdin; wait on a reader thread instead
+        line = _read_line_threaded(timeout)
+
+    if line is None:
+        print()
+        return None
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
@@ -2,28 +2,25 @@
 OmniProx provider modules
 """
 
-__all__ = []
+import importlib
 
-try:
-    from .gcp import GCPProvider
-    __all__.append('GCPProvider')
-except ImportError:
-    pass
+# Provider class -> submodule; each is imported (with its SDK) on first access
+_PROVIDER_MODULES = {
+    'GCPProvider': '.gcp',
+    'AzureProvider': '.azure',
+    'CloudflareProvider': '.cloudflare',
+    'AlibabaProvider': '.alibaba',
+}
 
-try:
-    from .azure import AzureProvider
-    __all__.append('AzureProvider')
-except ImportError:
-    pass
+__all__ = list(_PROVIDER_MODULES)
 
-try:
-    from .cloudflare import CloudflareProvider
-    __all__.append('CloudflareProvider')
-except ImportError:
-    pass
 
-try:
-    from .alibaba import AlibabaProvider
-    __all__.append('AlibabaProvider')
-except ImportError:
-    pass
\ No newline at end of file
+def __getattr__(name):
+    """Import a provider class on first access so unused cloud SDKs are never loaded"""
+    module_name = _PROVIDER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    provider_class = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = provider_class
+    return provider_class
\ No newline at end of file
@@ -9,26 +9,75 @@ import getpass
 import json
 import logging
 import os
-import random
-import string
+import secrets
 import sys
-import time
-import traceback
-from typing import Dict, List, Optional, Any
-from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import SimpleNamespace
+from typing import Dict, List, Mapping, Optional, Any
 
 from omniprox.core.base import BaseOmniProx
-from omniprox.core.utils import confirm_action
+from omniprox.core.utils import confirm_action, input_with_timeout
+
+# API configuration shared by every proxy, for better POST and path support
+_REQUEST_CONFIG_JSON = json.dumps({
+    "RequestProtocol": "HTTP,HTTPS",
+    "RequestHttpMethod": "ANY",  # Accept all methods
+    "RequestPath": "/*",  # Match all paths
+    "RequestMode": "PASSTHROUGH"  # Pass through all data
+})
+
+_SERVICE_CONFIG_DEFAULTS = {
+    "ServiceHttpMethod": "ANY",  # Support all HTTP methods
+    "ServiceTimeout": 60000,  # Increase timeout for POST operations
+    "ContentTypeCatagory": "DEFAULT",  # Auto-detect content type
+    "ContentTypeValue": "application/json;charset=utf-8"
+}
+
+_RESULT_SAMPLE = "{\"status\":\"success\"}"
+_FAIL_RESULT_SAMPLE = "{\"error\":\"proxy failed\"}"
+
+
+def _split_backend_url(url: str):
+    """Split a validated scheme://host/path URL, dropping any query or fragment
+
+    Returns:
+        tuple: (scheme, host, path) with path defaulting to "/"
+    """
+    scheme, _, rest = url.partition('://')
+    rest = rest.split('#', 1)[0].split('?', 1)[0]
+    host, slash, path = rest.partition('/')
+    return scheme, host, slash + path if slash else "/"
+
 
 class AlibabaProvider(BaseOmniProx):
     """Alibaba Cloud API Gateway provider"""
 
+    # Alibaba Cloud SDK modules, imported once by _ensure_sdk()
+    _SDK = None
+
+    # Every group and API created by OmniProx is named with these prefixes
+    _GROUP_PREFIX = 'omniprox-group-'
+    _API_PREFIX = 'omniprox-api-'
+
+    # Page size for Describe* listing calls (the API maximum is 100)
+    _PAGE_SIZE = 50
+
+    # Deployment stages an API may need undeploying from before deletion
+    _STAGES = ('RELEASE', 'TEST', 'PRE')
+
+    # Pooled connections on the shared client; each cleanup worker may undeploy
+    # from every stage at once, so the pool is sized to stay within them
+    _MAX_CONNS = 16
+    _CLEANUP_WORKERS = _MAX_CONNS // len(_STAGES)
+
     def __init__(self, args: Any):
         """Initialize Alibaba provider"""
         self.access_key_id = None
         self.access_key_secret = None
         self.region_id = 'cn-hangzhou'
         self.api_client = None
+        self._runtime = None
+        self.apis: List[Dict[str, str]] = []
         super().__init__('alibaba', args)
 
     def create_profile(self, config: configparser.ConfigParser, profile_name: str):
@@ -45,7 +94,7 @@ class AlibabaProvider(BaseOmniProx):
         self.save_profile(config)
         self.load_profile(config, profile_name)
 
-    def load_profile(self, config: configparser.ConfigParser, profile_name: str):
+    def load_profile(self, config: Mapping[str, Mapping[str, str]], profile_name: str):
         """Load Alibaba profile"""
         if profile_name in config:
             profile = config[profile_name]
@@ -56,25 +105,53 @@ class AlibabaProvider(BaseOmniProx):
                 self.region_id = self.args.region
             else:
                 self.region_id = profile.get('region_id', 'cn-hangzhou')
-            self.logger.info(f"Loaded Alibaba profile '{profile_name}'")
-            self.logger.debug(f"Alibaba credentials loaded for region: {self.region_id}")
+            self.logger.info("Loaded Alibaba profile '%s'", profile_name)
+            self.logger.debug("Alibaba credentials loaded for region: %s", self.region_id)
+
+    @classmethod
+    def _ensure_sdk(cls) -> SimpleNamespace:
+        """Import the Alibaba Cloud SDK on first use and reuse it afterwards
+
+        Raises:
+            ImportError: If the SDK is not installed
+        """
+        if cls._SDK is None:
+            from alibabacloud_cloudapi20160714 import models as cloudapi_models
+            from alibabacloud_cloudapi20160714.client import Client
+            from alibabacloud_tea_openapi import models as open_api_models
+            from alibabacloud_tea_util import models as util_models
+
+            cls._SDK = SimpleNamespace(
+                cloudapi_models=cloudapi_models,
+                util_models=util_models,
+                open_api_models=open_api_models,
+                Client=Client
+            )
+        return cls._SDK
 
     def init_provider(self) -> bool:
         """Initialize Alibaba Cloud SDK"""
+        # One client per provider instance, so batch operations share its connections
+        if self.api_client is not None:
+            return True
+
         try:
-            from alibabacloud_cloudapi20160714.client import Client
-            from alibabacloud_tea_openapi import models as open_api_models
+            sdk = self._ensure_sdk()
 
             self.logger.debug("Initializing Alibaba Cloud API client")
-            config = open_api_models.Config(
+            config = sdk.open_api_models.Config(
                 access_key_id=self.access_key_id,
                 access_key_secret=self.access_key_secret,
-                region_id=self.region_id
+                region_id=self.region_id,
+                # Keep idle keep-alive connections to the gateway endpoint for batched calls
+                max_idle_conns=self._MAX_CONNS
             )
             # Use correct endpoint format
             config.endpoint = f'apigateway.{self.region_id}.aliyuncs.com'
 
-            self.api_client = Client(config)
+            self.api_client = sdk.Client(config)
+            # Request options never vary, so every call shares one instance
+            self._runtime = sdk.util_models.RuntimeOptions()
             return True
 
         except ImportError:
@@ -82,7 +159,7 @@ class AlibabaProvider(BaseOmniProx):
             print("Run: pip install alibabacloud-cloudapi20160714 alibabacloud-tea-openapi")
             return False
         except Exception as e:
-            self.logger.error(f"Failed to initialize Alibaba API Gateway: {e}")
+            self.logger.error("Failed to initialize Alibaba API Gateway: %s", e)
             return False
 
     def create(self) -> bool:
@@ -94,21 +171,19 @@ class AlibabaProvider(BaseOmniProx):
             return False
 
         try:
-            from alibabacloud_cloudapi20160714 import models as cloudapi_models
-            from alibabacloud_tea_util import models as util_models
+            sdk = self._ensure_sdk()
+            cloudapi_models = sdk.cloudapi_models
 
-            parsed_url = urlparse(self.url)
-            backend_host = parsed_url.netloc
-            backend_path = parsed_url.path if parsed_url.path else "/"
+            backend_scheme, backend_host, backend_path = _split_backend_url(self.url)
             # Alibaba only supports HTTP protocol in ServiceConfig
             backend_protocol = "HTTP"
             # But the address should include the correct protocol
-            backend_address = f"{parsed_url.scheme}://{backend_host}"
+            backend_address = f"{backend_scheme}://{backend_host}"
 
             # Generate unique names
-            suffix = f"{int(time.time())}-{''.join(random.choices(string.ascii_lowercase, k=6))}"
-            group_name = f"omniprox-group-{suffix}"
-            api_name = f"omniprox-api-{suffix}"
+            suffix = secrets.token_hex(5)
+            group_name = self._GROUP_PREFIX + suffix
+            api_name = self._API_PREFIX + suffix
 
             print(f"\nCreating Alibaba API Gateway for: {self.url}")
             print(f"Region: {self.region_id}")
@@ -120,7 +195,7 @@ class AlibabaProvider(BaseOmniProx):
                 description=f"OmniProx API Group for {backend_host}"
             )
 
-            runtime = util_models.RuntimeOptions()
+            runtime = self._runtime
             group_response = self.api_client.create_api_group_with_options(
                 create_group_request,
                 runtime
@@ -132,30 +207,13 @@ class AlibabaProvider(BaseOmniProx):
             # 2. Create API
             print(f"Creating API in group {group_id}...")
 
-            # Enhanced API configuration for better POST and path support
-            api_config = {
-                "ServiceConfig": {
-                    "ServiceProtocol": backend_protocol,
-                    "ServiceAddress": backend_address,
-                    "ServicePath": backend_path if backend_path else "/",
-                    "ServiceHttpMethod": "ANY",  # Support all HTTP methods
-                    "ServiceTimeout": 60000,  # Increase timeout for POST operations
-                    "ContentTypeCatagory": "DEFAULT",  # Auto-detect content type
-                    "ContentTypeValue": "application/json;charset=utf-8"
-                },
-                "RequestConfig": {
-                    "RequestProtocol": "HTTP,HTTPS",
-                    "RequestHttpMethod": "ANY",  # Accept all methods
-                    "RequestPath": "/*",  # Match all paths
-                    "RequestMode": "PASSTHROUGH"  # Pass through all data
-                },
-                "RequestParameters": [],
-                "ServiceParameters": [],
-                "ServiceParametersMap": [],
-                "ResultType": "PASSTHROUGH",  # Pass through response as-is
-                "ResultSample": "{\"status\":\"success\"}",
-                "FailResultSample": "{\"error\":\"proxy failed\"}"
-            }
+            # Only the backend fields vary per proxy; the rest is precomputed at import
+            service_config = json.dumps({
+                "ServiceProtocol": backend_protocol,
+                "ServiceAddress": backend_address,
+                "ServicePath": backend_path if backend_path else "/",
+                **_SERVICE_CONFIG_DEFAULTS
+            })
 
             create_api_request = cloudapi_models.CreateApiRequest(
                 group_id=group_id,
@@ -163,11 +221,11 @@ class AlibabaProvider(BaseOmniProx):
                 description=f"OmniProx API for {backend_host}",
                 visibility="PUBLIC",  # Make it public for immediate use
                 auth_type="ANONYMOUS",
-                request_config=json.dumps(api_config["RequestConfig"]),
-                service_config=json.dumps(api_config["ServiceConfig"]),
-                result_type=api_config["ResultType"],
-                result_sample=api_config["ResultSample"],
-                fail_result_sample=api_config["FailResultSample"]
+                request_config=_REQUEST_CONFIG_JSON,
+                service_config=service_config,
+                result_type="PASSTHROUGH",  # Pass through response as-is
+                result_sample=_RESULT_SAMPLE,
+                fail_result_sample=_FAIL_RESULT_SAMPLE
             )
 
             api_response = self.api_client.create_api_with_options(
@@ -194,8 +252,6 @@ class AlibabaProvider(BaseOmniProx):
             proxy_url = f"https://{subdomain}"
 
             # Store in profile
-            if not hasattr(self, 'apis'):
-                self.apis = []
             self.apis.append({
                 'group_id': group_id,
                 'api_id': api_id,
@@ -219,10 +275,58 @@ class AlibabaProvider(BaseOmniProx):
             return True
 
         except Exception as e:
-            self.logger.error(f"Failed to create API Gateway: {e}")
+            self.logger.error("Failed to create API Gateway: %s", e)
             print(f"Error: Failed to create API Gateway: {e}")
             return False
 
+    def _iter_api_groups(self, group_name: Optional[str] = None):
+        """Yield API groups across every page of DescribeApiGroups
+
+        Args:
+            group_name: Keyword the gateway matches against group names, if any
+        """
+        sdk = self._ensure_sdk()
+        runtime = self._runtime
+        page_number = 1
+
+        while True:
+            request = sdk.cloudapi_models.DescribeApiGroupsRequest(
+                group_name=group_name,
+                page_size=self._PAGE_SIZE,
+                page_number=page_number
+            )
+            response = self.api_client.describe_api_groups_with_options(request, runtime)
+
+            attributes = response.body.api_group_attributes
+            groups = attributes.api_group_attribute if attributes and attributes.api_group_attribute else []
+            yield from groups
+
+            if len(groups) < self._PAGE_SIZE:
+                return
+            page_number += 1
+
+    def _iter_apis(self, group_id: str):
+        """Yield the APIs in a group across every page of DescribeApis"""
+        sdk = self._ensure_sdk()
+        runtime = self._runtime
+        page_number = 1
+
+        while True:
+            request = sdk.cloudapi_models.DescribeApisRequest(
+                group_id=group_id,
+                page_size=self._PAGE_SIZE,
+                page_number=page_number
+            )
+            response = self.api_client.describe_apis_with_options(request, runtime)
+
+            summaries = getattr(response.body, 'api_summarys', None)
+            apis = summaries.api_summary if summaries and summaries.api_summary else []
+            yield from apis
+
+            if len(apis) < self._PAGE_SIZE:
+                return
+            page_number += 1
+
     def list(self) -> bool:
         """List all Alibaba API Gateways"""
         self.logger.debug("Listing Alibaba API Gateways")
@@ -230,56 +334,29 @@ class AlibabaProvider(BaseOmniProx):
             return False
 
         try:
-            from alibabacloud_cloudapi20160714 import models as cloudapi_models
-            from alibabacloud_tea_util import models as util_models
-
             print(f"\nListing Alibaba API Gateways in region {self.region_id}...")
             print("-" * 60)
 
-            # List API Groups
-            list_groups_request = cloudapi_models.DescribeApiGroupsRequest(
-                page_size=50,
-                page_number=1
-            )
-
-            runtime = util_models.RuntimeOptions()
-            groups_response = self.api_client.describe_api_groups_with_options(
-                list_groups_request,
-                runtime
-            )
-
+            # List API Groups, filtered by name on the gateway side
             count = 0
-            if groups_response.body.api_group_attributes and groups_response.body.api_group_attributes.api_group_attribute:
-                for group in groups_response.body.api_group_attributes.api_group_attribute:
-                    if 'omniprox' in group.group_name.lower():
-                        count += 1
-                        print(f"\nAPI Group: {group.group_name}")
-                        print(f"  Group ID: {group.group_id}")
-                        print(f"  Subdomain: {group.sub_domain}")
-                        print(f"  Created: {group.created_time}")
-                        print(f"  Region: {group.region_id}")
-
-                        # List APIs in this group
-                        try:
-                            list_apis_request = cloudapi_models.DescribeApisRequest(
-                                group_id=group.group_id,
-                                page_size=50,
-                                page_number=1
-                            )
-
-                            apis_response = self.api_client.describe_apis_with_options(
-                                list_apis_request,
-                                runtime
-                            )
-
-                            if hasattr(apis_response.body, 'api_summarys') and apis_response.body.api_summarys:
-                                for api in apis_response.body.api_summarys.api_summary:
-                                    print(f"  API: {api.api_name} (ID: {api.api_id})")
-                                    print(f"    Stage: {api.stage_name if hasattr(api, 'stage_name') else 'N/A'}")
-                                    print(f"    Visibility: {api.visibility}")
-
-                        except Exception as e:
-                            self.logger.debug(f"Could not list APIs in group: {e}")
+            for group in self._iter_api_groups(self._GROUP_PREFIX):
+                if group.group_name.startswith(self._GROUP_PREFIX):
+                    count += 1
+                    print(f"\nAPI Group: {group.group_name}")
+                    print(f"  Group ID: {group.group_id}")
+                    print(f"  Subdomain: {group.sub_domain}")
+                    print(f"  Created: {group.created_time}")
+                    print(f"  Region: {group.region_id}")
+
+                    # List APIs in this group
+                    try:
+                        for api in self._iter_apis(group.group_id):
+                            print(f"  API: {api.api_name} (ID: {api.api_id})")
+                            print(f"    Stage: {api.stage_name if hasattr(api, 'stage_name') else 'N/A'}")
+                            print(f"    Visibility: {api.visibility}")
+
+                    except Exception as e:
+                        self.logger.debug("Could not list APIs in group: %s", e)
 
             if count == 0:
                 print("\nNo OmniProx API Gateways found")
@@ -289,37 +366,85 @@ class AlibabaProvider(BaseOmniProx):
             return True
 
         except Exception as e:
-            self.logger.error(f"Failed to list API Gateways: {e}")
-            self.logger.debug(f"Stack trace: {traceback.format_exc()}")
+            self.logger.error("Failed to list API Gateways: %s", e)
+            self.logger.debug("Stack trace:", exc_info=True)
             print(f"Error: Failed to list: {e}")
             return False
 
-    def _delete_api_only(self, api_id: str, group_id: str) -> bool:
-        """Delete only the API without attempting to delete the group"""
-        if not self.init_provider():
-            return False
+    def _deployed_stages(self, api) -> Optional[List[str]]:
+        """Return the stages an API is deployed to, from a DescribeApi(s) result
+
+        Args:
+            api: DescribeApi response body or DescribeApis summary
+
+        Returns:
+            list: Stage names, or None if the result carries no deployment info
+        """
+        deployed_infos = getattr(api, 'deployed_infos', None)
+        infos = getattr(deployed_infos, 'deployed_info', None)
+        if infos is None:
+            return None
+        return [info.stage_name for info in infos
+                if info.stage_name and info.deployed_status != 'NONDEPLOYED']
+
+    def _abolish_all_stages(self, api_id: str, group_id: str, stages: Optional[List[str]] = None):
+        """Undeploy an API from its stages concurrently
+
+        Stages are independent, so the requests are sent together. A stage
+        the API isn't deployed to is skipped quietly; any other failure
+        (throttling, permissions) is logged, since DeleteApi will fail after it.
+
+        Args:
+            api_id: API to undeploy
+            group_id: Group the API belongs to
+            stages: Stages it is deployed to, if known; otherwise every stage is tried
+        """
+        if stages is None:
+            stages = self._STAGES
+        if not stages:
+            return
+
+        sdk = self._ensure_sdk()
+        runtime = self._runtime
+
+        def abolish(stage):
+            abolish_request = sdk.cloudapi_models.AbolishApiRequest(
+                api_id=api_id,
+                group_id=group_id,
+                stage_name=stage
+            )
+            self.api_client.abolish_api_with_options(abolish_request, runtime)
 
+        with ThreadPoolExecutor(max_workers=len(stages)) as executor:
+            futures = {executor.submit(abolish, stage): stage for stage in stages}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    if 'NotFound' in str(getattr(e, 'code', '')):
+                        # API isn't deployed to this stage
+                        self.logger.debug("API %s not deployed to %s", api_id, futures[future])
+                    else:
+                        self.logger.warning("Could not undeploy API %s from %s: %s", api_id, futures[future], e)
+
+    def _delete_api_only(self, api_id: str, group_id: str, stages: Optional[List[str]] = None) -> bool:
+        """Delete only the API without attempting to delete the group
+
+        Callers must have run init_provider() already.
+
+        Args:
+            api_id: API to delete
+            group_id: Group the API belongs to
+            stages: Stages it is deployed to, if known
+        """
         try:
-            from alibabacloud_cloudapi20160714 import models as cloudapi_models
-            from alibabacloud_tea_util import models as util_models
+            sdk = self._ensure_sdk()
+            cloudapi_models = sdk.cloudapi_models
 
-            runtime = util_models.RuntimeOptions()
+            runtime = self._runtime
 
-            # 1. Undeploy API from all stages
-            try:
-                for stage in ['RELEASE', 'TEST', 'PRE']:
-                    abolish_request = cloudapi_models.AbolishApiRequest(
-                        api_id=api_id,
-                        group_id=group_id,
-                        stage_name=stage
-                    )
-                    self.api_client.abolish_api_with_options(
-                        abolish_request,
-                        runtime
-                    )
-            except Exception as e:
-                # API might not be deployed to all stages
-                self.logger.debug(f"Could not undeploy from all stages: {e}")
+            # 1. Undeploy API from its stages
+            self._abolish_all_stages(api_id, group_id, stages)
 
             # 2. Delete API
             delete_api_request = cloudapi_models.DeleteApiRequest(
@@ -335,7 +460,7 @@ class AlibabaProvider(BaseOmniProx):
             return True
 
         except Exception as e:
-            self.logger.error(f"Failed to delete API: {e}")
+            self.logger.error("Failed to delete API: %s", e)
             return False
 
     def delete(self) -> bool:
@@ -350,10 +475,10 @@ class AlibabaProvider(BaseOmniProx):
             return False
 
         try:
-            from alibabacloud_cloudapi20160714 import models as cloudapi_models
-            from alibabacloud_tea_util import models as util_models
+            sdk = self._ensure_sdk()
+            cloudapi_models = sdk.cloudapi_models
 
-            runtime = util_models.RuntimeOptions()
+            runtime = self._runtime
             group_id = None
 
             # Get API details to find group
@@ -368,21 +493,8 @@ class AlibabaProvider(BaseOmniProx):
 
             print(f"Deleting API {api_id}...")
 
-            # 1. Undeploy API from all stages
-            try:
-                for stage in ['RELEASE', 'TEST', 'PRE']:
-                    abolish_request = cloudapi_models.AbolishApiRequest(
-                        api_id=api_id,
-                        group_id=group_id,
-                        stage_name=stage
-                    )
-                    self.api_client.abolish_api_with_options(
-                        abolish_request,
-                        runtime
-                    )
-            except Exception as e:
-                # API might not be deployed to all stages
-                self.logger.debug(f"Could not undeploy from all stages: {e}")
+            # 1. Undeploy API from the stages DescribeApi reports it deployed to
+            self._abolish_all_stages(api_id, group_id, self._deployed_stages(api_response.body))
 
             # 2. Delete API
             delete_api_request = cloudapi_models.DeleteApiRequest(
@@ -408,48 +520,55 @@ class AlibabaProvider(BaseOmniProx):
                 )
                 print(f"  [OK] Deleted API Group: {group_id}")
             except Exception as e:
-                self.logger.debug(f"Could not delete group {group_id}: {e}")
+                self.logger.debug("Could not delete group %s: %s", group_id, e)
                 print(f"  [INFO] API Group {group_id} still has other APIs")
 
             return True
 
         except Exception as e:
-            self.logger.error(f"Failed to delete API Gateway: {e}")
+            self.logger.error("Failed to delete API Gateway: %s", e)
             print(f"Error: Failed to delete: {e}")
             return False
 
+    def _list_group_apis(self, group: Dict[str, str]) -> list:
+        """List every API in a group, for cleanup workers"""
+        return list(self._iter_apis(group['group_id']))
+
+    def _delete_group_api(self, group: Dict[str, str], api) -> bool:
+        """Undeploy and delete one API from a DescribeApis listing, for cleanup workers"""
+        return self._delete_api_only(api.api_id, group['group_id'], self._deployed_stages(api))
+
+    def _delete_group(self, group: Dict[str, str]) -> bool:
+        """Delete an API group once its APIs are gone, for cleanup workers"""
+        sdk = self._ensure_sdk()
+        try:
+            delete_group_request = sdk.cloudapi_models.DeleteApiGroupRequest(
+                group_id=group['group_id']
+            )
+            self.api_client.delete_api_group_with_options(
+                delete_group_request,
+                self._runtime
+            )
+            return True
+        except Exception as e:
+            # Group might already be deleted or have dependencies
+            self.logger.debug("Could not delete group %s: %s", group['group_name'], e)
+            return False
+
     def cleanup(self) -> bool:
         """Clean up all OmniProx API Gateways"""
         if not self.init_provider():
             return False
 
         try:
-            from alibabacloud_cloudapi20160714 import models as cloudapi_models
-            from alibabacloud_tea_util import models as util_models
-
             print("\nFinding all OmniProx API Gateways...")
 
-            runtime = util_models.RuntimeOptions()
-
-            # List all API Groups
-            list_groups_request = cloudapi_models.DescribeApiGroupsRequest(
-                page_size=50,
-                page_number=1
-            )
-
-            groups_response = self.api_client.describe_api_groups_with_options(
-                list_groups_request,
-                runtime
-            )
-
-            omniprox_groups = []
-            if groups_response.body.api_group_attributes and groups_response.body.api_group_attributes.api_group_attribute:
-                for group in groups_response.body.api_group_attributes.api_group_attribute:
-                    if 'omniprox' in group.group_name.lower():
-                        omniprox_groups.append({
-                            'group_id': group.group_id,
-                            'group_name': group.group_name
-                        })
+            # List all API Groups, filtered by name on the gateway side
+            omniprox_groups = [
+                {'group_id': group.group_id, 'group_name': group.group_name}
+                for group in self._iter_api_groups(self._GROUP_PREFIX)
+                if group.group_name.startswith(self._GROUP_PREFIX)
+            ]
 
             if not omniprox_groups:
                 print("No OmniProx API Gateways to clean up")
@@ -461,49 +580,35 @@ class AlibabaProvider(BaseOmniProx):
                 print("Cleanup cancelled")
                 return False
 
-            for group in omniprox_groups:
-                print(f"\nDeleting group {group['group_name']}...")
-
-                # List all APIs in group
-                list_apis_request = cloudapi_models.DescribeApisRequest(
-                    group_id=group['group_id'],
-                    page_size=50,
-                    page_number=1
-                )
-
-                apis_response = self.api_client.describe_apis_with_options(
-                    list_apis_request,
-                    runtime
-                )
-
-                # Delete all APIs (without trying to delete group after each one)
-                deleted_apis = 0
-                if hasattr(apis_response.body, 'api_summarys') and apis_response.body.api_summarys:
-                    for api in apis_response.body.api_summarys.api_summary:
-                        # Call delete but suppress group deletion attempts
-                        if self._delete_api_only(api.api_id, group['group_id']):
-                            deleted_apis += 1
-                            print(f"  [OK] Deleted API: {api.api_name}")
-
-                # Now delete the group after all APIs are removed
-                try:
-                    delete_group_request = cloudapi_models.DeleteApiGroupRequest(
-                        group_id=group['group_id']
-                    )
-                    self.api_client.delete_api_group_with_options(
-                        delete_group_request,
-                        runtime
-                    )
-                    print(f"  [OK] Deleted group {group['group_name']} (contained {deleted_apis} APIs)")
-                except Exception as e:
-                    # Group might already be deleted or have dependencies
-                    self.logger.debug(f"Could not delete group: {e}")
+            # One bounded pool for every call, since they all share the client's connections
+            with ThreadPoolExecutor(max_workers=self._CLEANUP_WORKERS) as executor:
+                group_apis = list(executor.map(self._list_group_apis, omniprox_groups))
+
+                # APIs are independent of each other, whichever group they are in
+                futures = {
+                    executor.submit(self._delete_group_api, group, api): (group, api)
+                    for group, apis in zip(omniprox_groups, group_apis)
+                    for api in apis
+                }
+                deleted_apis = {group['group_id']: 0 for group in omniprox_groups}
+                for future in as_completed(futures):
+                    group, api = futures[future]
+                    if future.result():
+                        deleted_apis[group['group_id']] += 1
+                        print(f"  [OK] Deleted API: {api.api_name} ({group['group_name']})")
+
+                # A group can only go once it is empty
+                results = executor.map(self._delete_group, omniprox_groups)
+                for group, deleted in zip(omniprox_groups, results):
+                    if deleted:
+                        print(f"  [OK] Deleted group {group['group_name']} "
+                              f"(contained {deleted_apis[group['group_id']]} APIs)")
 
             print(f"\n[OK] Cleanup completed")
             return True
 
         except Exception as e:
-            self.logger.error(f"Cleanup failed: {e}")
+            self.logger.error("Cleanup failed: %s", e)
             print(f"Error: Cleanup failed: {e}")
             return False
 
@@ -519,27 +624,12 @@ class AlibabaProvider(BaseOmniProx):
 
         # List API groups to show count
         try:
-            from alibabacloud_cloudapi20160714 import models as cloudapi_models
-            from alibabacloud_tea_util import models as util_models
-
-            list_groups_request = cloudapi_models.DescribeApiGroupsRequest(
-                page_size=50,
-                page_number=1
-            )
-
-            runtime = util_models.RuntimeOptions()
-            groups_response = self.api_client.describe_api_groups_with_options(
-                list_groups_request,
-                runtime
-            )
-
             total_groups = 0
             omniprox_groups = 0
-            if groups_response.body.api_group_attributes and groups_response.body.api_group_attributes.api_group_attribute:
-                for group in groups_response.body.api_group_attributes.api_group_attribute:
-                    total_groups += 1
-                    if 'omniprox' in group.group_name.lower():
-                        omniprox_groups += 1
+            for group in self._iter_api_groups():
+                total_groups += 1
+                if group.group_name.startswith(self._GROUP_PREFIX):
+                    omniprox_groups += 1
 
             print(f"\nAPI Group Statistics:")
             print(f"  Total API Groups: {total_groups}")
@@ -555,7 +645,7 @@ class AlibabaProvider(BaseOmniProx):
             return True
 
         except Exception as e:
-            self.logger.error(f"Failed to get status: {e}")
+            self.logger.error("Failed to get status: %s", e)
             print(f"Error: Failed to get status: {e}")
             return False
 
@@ -586,15 +676,18 @@ class AlibabaProvider(BaseOmniProx):
             if self.create():
                 print(f"\n[OK] Test proxy created successfully")
 
-                # Offer cleanup
+                # Offer cleanup, without hanging unattended runs
                 try:
-                    cleanup_choice = input(f"\nCleanup test proxy? (y/n): ").strip().lower()
-                    if cleanup_choice == 'y':
+                    cleanup_choice = input_with_timeout("\nCleanup test proxy? (y/n): ", 30)
+                    if cleanup_choice is None:
+                        print("No answer after 30s, keeping test proxy")
+                        print("Run 'omniprox --provider alibaba --command cleanup' to clean up manually")
+                    elif cleanup_choice.strip().lower() == 'y':
                         print("Cleaning up test proxy...")
                         self.cleanup()
                 except (EOFError, KeyboardInterrupt):
                     print("\nSkipping cleanup (non-interactive mode)")
-                    print(f"Run 'omniprox --provider alibaba --command cleanup' to clean up manually")
+                    print("Run 'omniprox --provider alibaba --command cleanup' to clean up manually")
 
                 self.url = original_url
                 return True
@@ -610,6 +703,6 @@ class AlibabaProvider(BaseOmniProx):
 
     def _get_last_created_proxy_url(self) -> Optional[str]:
         """Get the URL of the last created proxy for testing"""
-        if hasattr(self, 'apis') and self.apis:
+        if self.apis:
             return self.apis[-1].get('proxy_url')
         return None
\ No newline at end of file
@@ -3,54 +3,385 @@ Azure Provider for OmniProx
 Creates multiple Azure Container Instances for IP rotation
 """
 
+import base64
+import functools
+import gzip
 import json
 import logging
 import os
-import random
 import subprocess
-import sys
 import tempfile
-import textwrap
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Optional, Dict, Any, List, TYPE_CHECKING
 
 from omniprox.core.base import BaseOmniProx
 
-from omniprox.core.utils import confirm_action, get_unique_suffix
+from omniprox.core.utils import confirm_action, get_unique_suffix, input_with_timeout, write_private_file
+
+if TYPE_CHECKING:
+    from azure.mgmt.containerinstance.models import Container
 
 
+@functools.lru_cache(maxsize=None)
 def _get_rotate_client_path() -> Path:
-    """Get the path for the rotation client script (computed fresh each time)"""
+    """Get the path for the rotation client script (the temp dir is fixed per process)"""
     return Path(tempfile.gettempdir()) / 'omniprox_rotate.py'
 
-# Azure SDK imports
+
+# How long `az account show` output is reused before asking the CLI again
+_AZ_ACCOUNT_TTL = 12 * 60 * 60
+
+
+def _az_account_cache_path() -> Path:
+    return Path.home() / '.omniprox' / 'az_account.json'
+
+
+def _load_az_account() -> Optional[Dict[str, str]]:
+    """Return the cached Azure CLI account, or None if it is missing or stale
+
+    The cache is stale after _AZ_ACCOUNT_TTL, or once the CLI's own profile
+    (rewritten by `az login` and `az account set`) is newer than it.
+    """
+    cache_path = _az_account_cache_path()
+    try:
+        cached_at = cache_path.stat().st_mtime
+        if time.time() - cached_at > _AZ_ACCOUNT_TTL:
+            return None
+        try:
+            if (Path.home() / '.azure' / 'azureProfile.json').stat().st_mtime > cached_at:
+                return None
+        except OSError:
+            pass
+        account = json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        return None
+    return account if isinstance(account, dict) and account.get('subscription_id') else None
+
+
+def _read_az_default_account() -> Optional[Dict[str, str]]:
+    """Read the CLI's default subscription straight from its profile file
+
+    This is where `az account show` gets its answer, without the seconds
+    it takes to start the CLI. Returns None if the file is missing or has no
+    enabled default subscription.
+    """
+    try:
+        # The CLI writes this file with a UTF-8 byte order mark
+        with open(Path.home() / '.azure' / 'azureProfile.json', encoding='utf-8-sig') as f:
+            subscriptions = json.load(f).get('subscriptions') or []
+    except (OSError, ValueError, AttributeError):
+        return None
+    for subscription in subscriptions:
+        if subscription.get('isDefault') and subscription.get('state', 'Enabled') == 'Enabled' and subscription.get('id'):
+            return {
+                'subscription_id': subscription['id'],
+                'tenant_id': subscription.get('tenantId'),
+                'user': (subscription.get('user') or {}).get('name', 'Unknown')
+            }
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _compress_script(script: str) -> str:
+    """gzip and base64 a script for an environment variable, shrinking the ARM request
+
+    mtime=0 keeps the output identical for identical scripts.
+    """
+    return base64.b64encode(gzip.compress(script.encode(), mtime=0)).decode('ascii')
+
+
+def _save_az_account(account: Dict[str, str]) -> None:
+    try:
+        write_private_file(_az_account_cache_path(), json.dumps(account))
+    except OSError:
+        pass
+
+
+# orjson is an optional accelerator for container pool (de)serialization
 try:
-    from azure.identity import AzureCliCredential, ClientSecretCredential
-    from azure.mgmt.resource import ResourceManagementClient
-    from azure.mgmt.containerinstance import ContainerInstanceManagementClient
-    from azure.mgmt.containerinstance.models import (
-        ContainerGroup,
-        Container,
-        ContainerPort,
-        Port,
-        IpAddress,
-        ResourceRequests,
-        ResourceRequirements,
-        OperatingSystemTypes,
-        ContainerGroupRestartPolicy,
-        EnvironmentVariable
-    )
-    from azure.core.exceptions import ResourceNotFoundError, HttpResponseError
-    AZURE_AVAILABLE = True
+    import orjson
 except ImportError:
-    AZURE_AVAILABLE = False
+    orjson = None
+
+
+def _dumps(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _loads(text: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+# Resource Graph query for every container group OmniProx created in a subscription
+_OMNIPROX_GROUPS_QUERY = (
+    "Resources"
+    " | where type =~ 'microsoft.containerinstance/containergroups'"
+    " | where tags['created_by'] == 'omniprox'"
+    " | project name, resourceGroup, location, tags,"
+    " state = tostring(properties.provisioningState),"
+    " ip = tostring(properties.ipAddress.ip), fqdn = tostring(properties.ipAddress.fqdn)"
+)
+
+
+# Node.js proxy run in each container; __BASE_URL__ is replaced with the target URL,
+# which TARGET_URL overrides so the same script can be baked into an image
+_PROXY_SCRIPT_TEMPLATE = '''const http = require('http');
+const https = require('https');
+const url = require('url');
+
+const BASE_URL = process.env.TARGET_URL || '__BASE_URL__';
+
+const server = http.createServer((req, res) => {
+    let targetUrl;
+    const reqUrl = url.parse(req.url, true);
+
+    // Check for URL in query parameter first
+    if (reqUrl.query.url) {
+        targetUrl = reqUrl.query.url;
+    }
+    // Check if path starts with http
+    else if (req.url.startsWith('/http')) {
+        targetUrl = req.url.substring(1);
+    }
+    // Otherwise append path to base URL
+    else {
+        const baseUrl = new URL(BASE_URL);
+        baseUrl.pathname = baseUrl.pathname.replace(/\\/$/, '') + req.url;
+        targetUrl = baseUrl.toString();
+    }
+
+    console.log('Proxying to:', targetUrl);
+
+    // Parse target URL
+    const targetParsed = url.parse(targetUrl);
+    const protocol = targetParsed.protocol === 'https:' ? https : http;
+
+    // Copy headers and add IP rotation
+    const headers = Object.assign({}, req.headers);
+    headers.host = targetParsed.hostname;
+
+    // Rotate IPs for every request
+    const randomIP = () => Math.floor(Math.random()*255) + '.' +
+                           Math.floor(Math.random()*255) + '.' +
+                           Math.floor(Math.random()*255) + '.' +
+                           Math.floor(Math.random()*255);
+
+    // Handle custom X-Forwarded-For from X-My-X-Forwarded-For header
+    if (headers['x-my-x-forwarded-for']) {
+        headers['x-forwarded-for'] = headers['x-my-x-forwarded-for'];
+        headers['x-real-ip'] = headers['x-my-x-forwarded-for'].split(',')[0].trim();
+        delete headers['x-my-x-forwarded-for'];
+    } else {
+        headers['x-forwarded-for'] = randomIP();
+        headers['x-real-ip'] = randomIP();
+    }
+    delete headers['host-length'];
+
+    // Make request
+    const options = {
+        hostname: targetParsed.hostname,
+        port: targetParsed.port || (targetParsed.protocol === 'https:' ? 443 : 80),
+        path: targetParsed.path,
+        method: req.method,
+        headers: headers
+    };
+
+    const proxyReq = protocol.request(options, (proxyRes) => {
+        res.writeHead(proxyRes.statusCode, proxyRes.headers);
+        proxyRes.pipe(res);
+    });
+
+    proxyReq.on('error', (err) => {
+        res.writeHead(502, {'Content-Type': 'text/plain'});
+        res.end('Proxy error: ' + err.message);
+    });
+
+    req.pipe(proxyReq);
+});
+
+server.listen(80, () => {
+    console.log('OmniProx proxy running on port 80');
+    console.log('Base URL:', BASE_URL);
+});
+'''
+
+
+# Rotation client written by create(); __POOL_PATH__ is replaced with the quoted pool file path
+_ROTATE_CLIENT_TEMPLATE = '''#!/usr/bin/env python3
+"""
+OmniProx Azure Container Pool Rotation Client
+Automatically rotates through container pool for each request
+"""
+
+import json
+import random
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List
+
+import requests
+
+# Container pool configuration, kept up to date by OmniProx
+with open(__POOL_PATH__) as f:
+    CONTAINER_POOL = json.load(f)
+
+class RotatingProxy:
+    def __init__(self, container_pool: List[Dict]):
+        self.pool = container_pool
+        self.current_index = 0
+
+    def get_random_proxy(self) -> str:
+        """Get a random proxy from the pool"""
+        return random.choice(self.pool)['url'] if self.pool else None
+
+    def get_next_proxy(self) -> str:
+        """Get the next proxy in rotation"""
+        if not self.pool:
+            return None
+        proxy = self.pool[self.current_index]['url']
+        self.current_index = (self.current_index + 1) % len(self.pool)
+        return proxy
+
+    def make_request(self, path="", method="GET", rotate_type="random", **kwargs):
+        """Make a request through a proxy"""
+        if rotate_type == "random":
+            proxy_url = self.get_random_proxy()
+        else:
+            proxy_url = self.get_next_proxy()
+
+        if not proxy_url:
+            print("Error: No proxies available")
+            return None
+
+        return self._report(proxy_url, self._send(proxy_url, path, method, **kwargs))
+
+    def _send(self, proxy_url, path="", method="GET", **kwargs):
+        """Send a request through proxy_url, returning the response or the exception"""
+        kwargs.setdefault('timeout', 10)
+        try:
+            return requests.request(method, f"{proxy_url}{path}", **kwargs)
+        except Exception as e:
+            return e
+
+    def _report(self, proxy_url, result):
+        """Print the outcome of _send, returning the response or None"""
+        if isinstance(result, Exception):
+            print(f"Error: Request to {proxy_url} failed: {result}")
+            return None
+        proxy_ip = next((p['ip'] for p in self.pool if p['url'] == proxy_url), 'unknown')
+        print(f"[OK] Request via: {proxy_url} (IP: {proxy_ip})")
+        return result
+
+    def test_rotation(self, num_requests=5, stop=None):
+        """Test IP rotation with multiple requests
+
+        Gives up without reporting if stop (a threading.Event) is set first.
+        """
+        print(f"\\n[ROTATE] Testing IP Rotation with {num_requests} requests:")
+        print("-" * 60)
+
+        ips_seen = set()
+        successful = 0
+
+        # The requests are independent, so send them all at once and report in order
+        proxies = [self.get_random_proxy() for _ in range(num_requests)]
+        with ThreadPoolExecutor(max_workers=max(1, min(num_requests, 16))) as executor:
+            futures = [executor.submit(self._send, proxy_url) for proxy_url in proxies]
+            while wait(futures, timeout=0.2).not_done:
+                if stop is not None and stop.is_set():
+                    for future in futures:
+                        future.cancel()
+                    return
+            results = [future.result() for future in futures]
+
+        for i, (proxy_url, result) in enumerate(zip(proxies, results)):
+            print(f"\\nRequest {i+1}:")
+            response = self._report(proxy_url, result)
+            if response:
+                successful += 1
+                # Try to extract IP from response
+                if response.headers.get('X-Real-IP'):
+                    ip = response.headers['X-Real-IP']
+                elif 'ip' in response.text.lower():
+                    # Try to extract IP from response body
+                    ip = response.text.strip()[:20]
+                else:
+                    ip = "Response received"
+                ips_seen.add(ip)
+                print(f"  Response: {ip[:50]}")
+
+        print("\\n" + "="*60)
+        print(f"[STATS] Test Results:")
+        print(f"  Successful Requests: {successful}/{num_requests}")
+        print(f"  Unique Responses: {len(ips_seen)}")
+        print(f"  Container Pool Size: {len(self.pool)}")
+        print(f"  Unique IPs in Pool: {len(set(c['ip'] for c in self.pool))}")
+
+def main(argv=None, stop=None):
+    args = sys.argv[1:] if argv is None else argv
+    proxy = RotatingProxy(CONTAINER_POOL)
+
+    if not CONTAINER_POOL:
+        print("Error: No container pool configured")
+        print("Run: python3 omniprox.py --provider azure-pool --command create --url <target>")
+        return 1
+
+    print(f"[GLOBAL] OmniProx Container Pool Active")
+    print(f"   Pool Size: {len(CONTAINER_POOL)} containers")
+    print(f"   Target: {CONTAINER_POOL[0].get('target', 'unknown')}")
+
+    if args:
+        if args[0] == "test":
+            proxy.test_rotation(int(args[1]) if len(args) > 1 else 5, stop)
+        elif args[0] == "list":
+            print("\\n[LIST] Container Pool:")
+            for i, container in enumerate(CONTAINER_POOL, 1):
+                print(f"  {i}. {container['url']} (IP: {container['ip']})")
+        else:
+            # Make request with provided path
+            response = proxy.make_request(args[0])
+            if response:
+                print(response.text)
+    else:
+        # Make a single test request
+        response = proxy.make_request()
+        if response:
+            print(f"\\n📄 Response: {response.text[:200]}")
+
+if __name__ == "__main__":
+    main()
+'''
+
+
+def _render_rotate_client(pool_path: Path) -> str:
+    """Fill in the rotation client template for a pool file"""
+    return _ROTATE_CLIENT_TEMPLATE.replace('__POOL_PATH__', repr(str(pool_path)))
+
 
+def _load_rotate_client(pool_path: Path) -> Dict[str, Any]:
+    """Load the rotation client from the packaged template into a namespace
+
+    The script on disk is only for users to run; loading from the template
+    means nothing outside the package runs in a process holding credentials.
+    """
+    namespace = {'__name__': 'omniprox_rotate'}
+    exec(compile(_render_rotate_client(pool_path), '<omniprox_rotate>', 'exec'), namespace)
+    return namespace
 
 class AzureProvider(BaseOmniProx):
     """Azure provider for IP rotation using Container Instances"""
 
+    # Azure SDK modules, imported once by _ensure_sdk()
+    _SDK = None
+
     def __init__(self, args):
         """Initialize Azure provider"""
         # Initialize base attributes first
@@ -62,66 +393,145 @@ class AzureProvider(BaseOmniProx):
         self.resource_group = None
         self.pool_size = getattr(args, 'number', 3)  # Number of containers in pool
         self.use_cli = True
+        # Pre-built proxy image; if unset the script is injected into a stock Node image
+        self.container_image = None
 
         # Azure clients
         self.credential = None
         self.resource_client = None
         self.aci_client = None
+        # Resource Graph client, created on first query since the package is optional
+        self.graph_client = None
+        # HTTP transport shared by every client, so they reuse pooled connections
+        self._transport = None
 
-        # Container pool management
-        self.container_pool = []
+        # Container pool management; a loaded profile's pool is only read when first used
+        self._container_pool = []
+        self._pool_path = None
+        self._pool_json = '[]'
 
         # Initialize base class (this will call load_profile)
         super().__init__('azure', args)
 
     def load_profile(self, config, profile_name):
         """Load Azure configuration from profile"""
-        self.config = config
         self.logger.info(f"Loading existing profile '{self.profile}'")
         print(f"Loading profile '{self.profile}' for AZURE...")
 
         # Load configuration values
-        self.subscription_id = config.get(profile_name, 'subscription_id', fallback=None)
-        self.tenant_id = config.get(profile_name, 'tenant_id', fallback=None)
-        self.client_id = config.get(profile_name, 'client_id', fallback=None)
-        self.client_secret = config.get(profile_name, 'client_secret', fallback=None)
+        profile = config[profile_name]
+        self.subscription_id = profile.get('subscription_id')
+        self.tenant_id = profile.get('tenant_id')
+        self.client_id = profile.get('client_id')
+        self.client_secret = profile.get('client_secret')
         # Override location with command line argument if provided
         if hasattr(self.args, 'region') and self.args.region:
             self.location = self.args.region
         else:
-            self.location = config.get(profile_name, 'location', fallback='eastus')
-        self.resource_group = config.get(profile_name, 'resource_group', fallback=None)
-        self.use_cli = config.get(profile_name, 'use_cli', fallback='true').lower() == 'true'
+            self.location = profile.get('location', 'eastus')
+        self.resource_group = profile.get('resource_group')
+        self.use_cli = profile.get('use_cli', 'true').lower() == 'true'
+        self.container_image = profile.get('container_image') or None
+
+        # Existing pool, if configured; older profiles embed it in the INI
+        self._pool_path = profile.get('container_pool_path')
+        self._pool_json = profile.get('container_pool', '[]')
+        self._container_pool = None
+
+    @property
+    def container_pool(self) -> List[Dict[str, Any]]:
+        """Configured container pool, read from the profile on first access"""
+        if self._container_pool is None:
+            try:
+                if self._pool_path:
+                    self._container_pool = _loads(Path(self._pool_path).read_text())
+                else:
+                    self._container_pool = _loads(self._pool_json)
+            except (OSError, ValueError, TypeError):
+                self._container_pool = []
+        return self._container_pool
 
-        # Load existing pool if configured
-        pool_json = config.get(profile_name, 'container_pool', fallback='[]')
-        try:
-            self.container_pool = json.loads(pool_json)
-        except (json.JSONDecodeError, ValueError, TypeError):
-            self.container_pool = []
+    @container_pool.setter
+    def container_pool(self, pool: List[Dict[str, Any]]):
+        self._container_pool = pool
+
+    def _pool_file_path(self) -> Path:
+        """Path of the JSON file holding this profile's container pool"""
+        return self.config_path.parent / f"{self.provider}_{self.profile}_pool.json"
 
     def save_pool_config(self):
         """Save container pool configuration"""
         section = f"{self.provider}:{self.profile}"
 
-        if not self.config.has_section(section):
-            self.config.add_section(section)
+        # Full file, so other profiles are written back untouched
+        config = self._writable_config()
+
+        if not config.has_section(section):
+            config.add_section(section)
+
+        config.set(section, 'subscription_id', self.subscription_id or '')
+        config.set(section, 'location', self.location)
+        config.set(section, 'resource_group', self.resource_group or '')
+        config.set(section, 'use_cli', 'true' if self.use_cli else 'false')
+        if self.container_image:
+            config.set(section, 'container_image', self.container_image)
 
-        self.config.set(section, 'subscription_id', self.subscription_id or '')
-        self.config.set(section, 'location', self.location)
-        self.config.set(section, 'resource_group', self.resource_group or '')
-        self.config.set(section, 'use_cli', 'true' if self.use_cli else 'false')
-        self.config.set(section, 'container_pool', json.dumps(self.container_pool))
+        # The pool lives in its own file so profiles.ini stays small as pools grow
+        pool_path = self._pool_file_path()
+        write_private_file(pool_path, _dumps(self.container_pool))
+        config.set(section, 'container_pool_path', str(pool_path))
+        config.remove_option(section, 'container_pool')
 
-        # Save to file
-        with open(self.config_path, 'w') as f:
-            self.config.write(f)
+        self.save_profile(config)
 
         self.logger.info("Updated profile with container pool")
 
+    @classmethod
+    def _ensure_sdk(cls) -> SimpleNamespace:
+        """Import the Azure SDK on first use and reuse it afterwards
+
+        Resource Graph is optional, so resourcegraph is None when it is not installed.
+
+        Raises:
+            ImportError: If the SDK is not installed
+        """
+        if cls._SDK is None:
+            from azure.core.exceptions import ResourceNotFoundError
+            from azure.core.pipeline.transport import RequestsTransport
+            from azure.identity import AzureCliCredential, ClientSecretCredential
+            from azure.mgmt.containerinstance import ContainerInstanceManagementClient
+            from azure.mgmt.containerinstance import models as aci_models
+            from azure.mgmt.resource import ResourceManagementClient
+
+            try:
+                from azure.mgmt.resourcegraph import ResourceGraphClient
+                from azure.mgmt.resourcegraph import models as resourcegraph_models
+                resourcegraph = SimpleNamespace(ResourceGraphClient=ResourceGraphClient, models=resourcegraph_models)
+            except ImportError:
+                resourcegraph = None
+
+            cls._SDK = SimpleNamespace(
+                ResourceNotFoundError=ResourceNotFoundError,
+                RequestsTransport=RequestsTransport,
+                AzureCliCredential=AzureCliCredential,
+                ClientSecretCredential=ClientSecretCredential,
+                ContainerInstanceManagementClient=ContainerInstanceManagementClient,
+                ResourceManagementClient=ResourceManagementClient,
+                aci_models=aci_models,
+                resourcegraph=resourcegraph
+            )
+        return cls._SDK
+
     def init_provider(self):
         """Initialize Azure provider and verify credentials"""
-        if not AZURE_AVAILABLE:
+        # Keep the credential and its token cache for the rest of the run; proxytest
+        # calls create() and then cleanup(), and each would otherwise log in again
+        if self.aci_client is not None:
+            return True
+
+        try:
+            sdk = self._ensure_sdk()
+        except ImportError:
             print("Error: Azure SDK not installed")
             print("Install with: pip install azure-mgmt-containerinstance azure-mgmt-resource azure-identity")
             return False
@@ -129,34 +539,47 @@ class AzureProvider(BaseOmniProx):
         # Initialize credential
         if self.use_cli:
             self.logger.info("Configured to use Azure CLI credentials")
-            self.credential = AzureCliCredential()
-
-            # Verify CLI authentication
-            try:
-                result = subprocess.run(
-                    ['az', 'account', 'show'],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                if result.returncode == 0:
-                    account_info = json.loads(result.stdout)
-                    self.logger.info(f"Found active Azure account: {account_info.get('user', {}).get('name', 'Unknown')}")
-                    if not self.subscription_id:
-                        self.subscription_id = account_info.get('id')
-                else:
-                    print("Error: No active Azure CLI session")
-                    print("Run: az login")
+            self.credential = sdk.AzureCliCredential()
+
+            # Verify CLI authentication from a recent `az account show` or the CLI's
+            # own profile file, since starting the CLI costs seconds; the credential
+            # refreshes its own tokens
+            account = None
+            if not getattr(self.args, 'refresh_auth', False):
+                account = _load_az_account() or _read_az_default_account()
+            if account is None:
+                try:
+                    result = subprocess.run(
+                        ['az', 'account', 'show'],
+                        capture_output=True,
+                        text=True,
+                        timeout=30
+                    )
+                    if result.returncode == 0:
+                        account_info = json.loads(result.stdout)
+                        account = {
+                            'subscription_id': account_info.get('id'),
+                            'tenant_id': account_info.get('tenantId'),
+                            'user': account_info.get('user', {}).get('name', 'Unknown')
+                        }
+                        _save_az_account(account)
+                    else:
+                        print("Error: No active Azure CLI session")
+                        print("Run: az login")
+                        return False
+                except (subprocess.CalledProcessError, subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError, OSError) as e:
+                    self.logger.error(f"Error checking Azure CLI: {e}")
                     return False
-            except (subprocess.CalledProcessError, subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError, OSError) as e:
-                self.logger.error(f"Error checking Azure CLI: {e}")
-                return False
+
+            self.logger.info(f"Found active Azure account: {account.get('user', 'Unknown')}")
+            if not self.subscription_id:
+                self.subscription_id = account.get('subscription_id')
         else:
             if not all([self.tenant_id, self.client_id, self.client_secret]):
                 print("Error: Service principal credentials not configured")
                 return False
 
-            self.credential = ClientSecretCredential(
+            self.credential = sdk.ClientSecretCredential(
                 tenant_id=self.tenant_id,
                 client_id=self.client_id,
                 client_secret=self.client_secret
@@ -164,14 +587,21 @@ class AzureProvider(BaseOmniProx):
 
         # Initialize Azure clients
         try:
-            self.resource_client = ResourceManagementClient(
+            self._transport = self._build_transport(sdk)
+
+            self.resource_client = sdk.ResourceManagementClient(
                 self.credential,
-                self.subscription_id
+                self.subscription_id,
+                transport=self._transport
             )
 
-            self.aci_client = ContainerInstanceManagementClient(
+            self.aci_client = sdk.ContainerInstanceManagementClient(
                 self.credential,
-                self.subscription_id
+                self.subscription_id,
+                # ACI deployments and deletions usually finish within a few polls of
+                # this; the SDK default of 30s left callers idle for most of one
+                polling_interval=5,
+                transport=self._transport
             )
 
             return True
@@ -179,122 +609,80 @@ class AzureProvider(BaseOmniProx):
             self.logger.error(f"Error initializing Azure clients: {e}")
             return False
 
+    @staticmethod
+    def _build_transport(sdk: SimpleNamespace) -> Any:
+        """Build a keep-alive transport for all clients to share
+
+        Sized for the concurrent create/delete fan-out. Retries are left to the
+        SDK pipeline, as with the transport it would otherwise create itself.
+        """
+        import requests
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(total=False, redirect=False, raise_on_status=False)
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return sdk.RequestsTransport(session=session, session_owner=False)
+
     def _get_proxy_script(self, target_url: str) -> str:
         """Generate the Node.js proxy script content.
 
         Separated from container creation to avoid shell escaping issues.
         The script is passed via environment variable and written to file at runtime.
         """
-        return f'''const http = require('http');
-const https = require('https');
-const url = require('url');
-
-const BASE_URL = '{target_url}';
-
-const server = http.createServer((req, res) => {{
-    let targetUrl;
-    const reqUrl = url.parse(req.url, true);
-
-    // Check for URL in query parameter first
-    if (reqUrl.query.url) {{
-        targetUrl = reqUrl.query.url;
-    }}
-    // Check if path starts with http
-    else if (req.url.startsWith('/http')) {{
-        targetUrl = req.url.substring(1);
-    }}
-    // Otherwise append path to base URL
-    else {{
-        const baseUrl = new URL(BASE_URL);
-        baseUrl.pathname = baseUrl.pathname.replace(/\\/$/, '') + req.url;
-        targetUrl = baseUrl.toString();
-    }}
-
-    console.log('Proxying to:', targetUrl);
-
-    // Parse target URL
-    const targetParsed = url.parse(targetUrl);
-    const protocol = targetParsed.protocol === 'https:' ? https : http;
-
-    // Copy headers and add IP rotation
-    const headers = Object.assign({{}}, req.headers);
-    headers.host = targetParsed.hostname;
-
-    // Rotate IPs for every request
-    const randomIP = () => Math.floor(Math.random()*255) + '.' +
-                           Math.floor(Math.random()*255) + '.' +
-                           Math.floor(Math.random()*255) + '.' +
-                           Math.floor(Math.random()*255);
-
-    // Handle custom X-Forwarded-For from X-My-X-Forwarded-For header
-    if (headers['x-my-x-forwarded-for']) {{
-        headers['x-forwarded-for'] = headers['x-my-x-forwarded-for'];
-        headers['x-real-ip'] = headers['x-my-x-forwarded-for'].split(',')[0].trim();
-        delete headers['x-my-x-forwarded-for'];
-    }} else {{
-        headers['x-forwarded-for'] = randomIP();
-        headers['x-real-ip'] = randomIP();
-    }}
-    delete headers['host-length'];
-
-    // Make request
-    const options = {{
-        hostname: targetParsed.hostname,
-        port: targetParsed.port || (targetParsed.protocol === 'https:' ? 443 : 80),
-        path: targetParsed.path,
-        method: req.method,
-        headers: headers
-    }};
-
-    const proxyReq = protocol.request(options, (proxyRes) => {{
-        res.writeHead(proxyRes.statusCode, proxyRes.headers);
-        proxyRes.pipe(res);
-    }});
-
-    proxyReq.on('error', (err) => {{
-        res.writeHead(502, {{'Content-Type': 'text/plain'}});
-        res.end('Proxy error: ' + err.message);
-    }});
-
-    req.pipe(proxyReq);
-}});
+        return _PROXY_SCRIPT_TEMPLATE.replace('__BASE_URL__', target_url)
 
-server.listen(80, () => {{
-    console.log('OmniProx proxy running on port 80');
-    console.log('Base URL:', BASE_URL);
-}});
-'''
-
-    def create_nginx_container(self, name: str, target_url: str) -> 'Container':
+    def create_nginx_container(self, name: str, target_url: str, proxy_script: Optional[str] = None) -> 'Container':
         """Create HTTP proxy container with path preservation.
 
         Uses environment variable to pass the proxy script, avoiding shell
-        escaping issues that occur with inline script execution.
+        escaping issues that occur with inline script execution. If the profile
+        sets container_image, that image is run as-is with only TARGET_URL.
         """
-        # Get the proxy script content
-        proxy_script = self._get_proxy_script(target_url)
+        models = self._ensure_sdk().aci_models
+        resources = models.ResourceRequirements(
+            requests=models.ResourceRequests(
+                memory_in_gb=0.5,  # Minimal memory
+                cpu=0.5  # Minimal CPU
+            )
+        )
+
+        if self.container_image:
+            return models.Container(
+                name=name,
+                image=self.container_image,
+                resources=resources,
+                ports=[models.ContainerPort(port=80)],
+                environment_variables=[
+                    models.EnvironmentVariable(name='TARGET_URL', value=target_url)
+                ]
+            )
+
+        # Get the proxy script content, unless the caller already built it
+        if proxy_script is None:
+            proxy_script = self._get_proxy_script(target_url)
 
         # Command writes the script from env var to file, then executes it
         # This avoids complex shell escaping issues with inline scripts
         command = [
             'sh', '-c',
-            'echo "$PROXY_SCRIPT" > /tmp/proxy.js && node /tmp/proxy.js'
+            'echo "$PROXY_SCRIPT_GZ" | base64 -d | gunzip > /tmp/proxy.js && node /tmp/proxy.js'
         ]
 
-        container = Container(
+        container = models.Container(
             name=name,
             image='mcr.microsoft.com/mirror/docker/library/node:18-alpine',
-            resources=ResourceRequirements(
-                requests=ResourceRequests(
-                    memory_in_gb=0.5,  # Minimal memory
-                    cpu=0.5  # Minimal CPU
-                )
-            ),
-            ports=[ContainerPort(port=80)],
+            resources=resources,
+            ports=[models.ContainerPort(port=80)],
             command=command,
             environment_variables=[
-                EnvironmentVariable(name='TARGET_URL', value=target_url),
-                EnvironmentVariable(name='PROXY_SCRIPT', value=proxy_script)
+                models.EnvironmentVariable(name='TARGET_URL', value=target_url),
+                models.EnvironmentVariable(name='PROXY_SCRIPT_GZ', value=_compress_script(proxy_script))
             ]
         )
 
@@ -311,10 +699,11 @@ server.listen(80, () => {{
 
         try:
             # Auto-generate names if not provided
-            timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
+            now = datetime.now()
+            timestamp = now.strftime('%Y%m%d%H%M%S')
 
             if not self.resource_group:
-                self.resource_group = f"omniprox-pool-{datetime.now().strftime('%Y%m%d')}"
+                self.resource_group = f"omniprox-pool-{now.strftime('%Y%m%d')}"
                 self.logger.info(f"Auto-generating resource group name: {self.resource_group}")
 
             # Create or verify resource group
@@ -322,7 +711,7 @@ server.listen(80, () => {{
                 rg = self.resource_client.resource_groups.get(self.resource_group)
                 self.logger.info(f"Using existing resource group: {self.resource_group}")
                 print(f"Using existing resource group: {self.resource_group}")
-            except ResourceNotFoundError:
+            except self._ensure_sdk().ResourceNotFoundError:
                 self.logger.info(f"Creating resource group: {self.resource_group}")
                 print(f"Creating resource group: {self.resource_group} in {self.location}...")
 
@@ -350,27 +739,34 @@ server.listen(80, () => {{
             self.container_pool = []
             successful_containers = 0
 
+            # Start every deployment first; ARM runs them concurrently and each
+            # poller tracks its own long-running operation in the background
+            models = self._ensure_sdk().aci_models
+            deployments = []
+            proxy_script = None if self.container_image else self._get_proxy_script(self.url)
             for i in range(1, self.pool_size + 1):
-                container_group_name = f"omniprox-pool-{i}-{get_unique_suffix()}"
-                dns_label = f"omniprox-{i}-{get_unique_suffix()}"
+                # Group name and DNS label share a suffix so they are easy to match up
+                suffix = get_unique_suffix()
+                container_group_name = f"omniprox-pool-{i}-{suffix}"
+                dns_label = f"omniprox-{i}-{suffix}"
 
                 print(f"\n[{i}/{self.pool_size}] Creating container: {container_group_name}")
 
                 try:
                     # Create container configuration
-                    container = self.create_nginx_container(f"proxy-{i}", self.url)
+                    container = self.create_nginx_container(f"proxy-{i}", self.url, proxy_script)
 
                     # Create container group
-                    container_group = ContainerGroup(
+                    container_group = models.ContainerGroup(
                         location=self.location,
                         containers=[container],
-                        os_type=OperatingSystemTypes.linux,
-                        ip_address=IpAddress(
-                            ports=[Port(port=80, protocol='TCP')],
+                        os_type=models.OperatingSystemTypes.linux,
+                        ip_address=models.IpAddress(
+                            ports=[models.Port(port=80, protocol='TCP')],
                             type='Public',
                             dns_name_label=dns_label.lower()
                         ),
-                        restart_policy=ContainerGroupRestartPolicy.always,
+                        restart_policy=models.ContainerGroupRestartPolicy.always,
                         tags={
                             'created_by': 'omniprox',
                             'pool_id': timestamp,
@@ -385,35 +781,51 @@ server.listen(80, () => {{
                         container_group_name,
                         container_group
                     )
+                    deployments.append((i, container_group_name, operation))
 
-                    # Wait for deployment (with timeout)
-                    result = operation.result(timeout=60)
-
-                    # Get the public IP/FQDN
-                    if result.ip_address:
-                        container_info = {
-                            'name': container_group_name,
-                            'ip': result.ip_address.ip,
-                            'fqdn': result.ip_address.fqdn or f"{result.ip_address.ip}",
-                            'url': f"http://{result.ip_address.fqdn or result.ip_address.ip}",
-                            'target': self.url
-                        }
-
-                        self.container_pool.append(container_info)
-                        successful_containers += 1
+                except Exception as e:
+                    print(f"  [FAILED] {str(e)[:100]}")
+                    self.logger.error(f"Failed to create container {i}: {e}")
 
-                        print(f"  [OK] Deployed: {container_info['url']}")
-                        print(f"       IP: {container_info['ip']}")
-                    else:
-                        print(f"  [WARNING] Deployed but no IP assigned")
+            if deployments:
+                print(f"\nWaiting for {len(deployments)} deployment(s)...")
 
+            # All deployments run at once, so one deadline bounds the whole pool
+            deadline = time.monotonic() + 300
+            settled = []
+            for i, container_group_name, operation in deployments:
+                try:
+                    remaining = max(0, deadline - time.monotonic())
+                    settled.append((container_group_name, operation.result(timeout=remaining)))
                 except Exception as e:
-                    print(f"  [FAILED] {str(e)[:100]}")
+                    print(f"  [FAILED] {container_group_name}: {str(e)[:100]}")
                     self.logger.error(f"Failed to create container {i}: {e}")
 
-                # Small delay between container creations
-                if i < self.pool_size:
-                    time.sleep(2)
+            # The operation result can predate IP assignment, so re-read those groups
+            refreshed = self._get_container_groups(
+                [name for name, result in settled if not (result and result.ip_address and result.ip_address.ip)]
+            )
+
+            for container_group_name, result in settled:
+                result = refreshed.get(container_group_name, result)
+
+                # Get the public IP/FQDN
+                if result and result.ip_address:
+                    container_info = {
+                        'name': container_group_name,
+                        'ip': result.ip_address.ip,
+                        'fqdn': result.ip_address.fqdn or f"{result.ip_address.ip}",
+                        'url': f"http://{result.ip_address.fqdn or result.ip_address.ip}",
+                        'target': self.url
+                    }
+
+                    self.container_pool.append(container_info)
+                    successful_containers += 1
+
+                    print(f"  [OK] {container_group_name}: {container_info['url']}")
+                    print(f"       IP: {container_info['ip']}")
+                else:
+                    print(f"  [WARNING] {container_group_name}: deployed but no IP assigned")
 
             # Save pool configuration
             self.save_pool_config()
@@ -441,8 +853,8 @@ server.listen(80, () => {{
 
                 rotate_path = _get_rotate_client_path()
                 print(f"\nUsage Examples:")
-                print(f"  # Random proxy from pool:")
-                print(f"  curl '{random.choice(self.container_pool)['url']}'")
+                print(f"  # First proxy in the pool (or any URL listed above):")
+                print(f"  curl '{self.container_pool[0]['url']}'")
                 print(f"\n  # Python rotation client:")
                 print(f"  python3 {rotate_path}")
                 print(f"\n  # Test IP rotation:")
@@ -458,127 +870,34 @@ server.listen(80, () => {{
             print(f"Error: {e}")
             return False
 
-    def create_rotation_client(self) -> None:
-        """Create a Python client for rotating through the container pool"""
-        client_script = textwrap.dedent('''#!/usr/bin/env python3
-"""
-OmniProx Azure Container Pool Rotation Client
-Automatically rotates through container pool for each request
-"""
-
-import json
-import random
-import sys
-from typing import Dict, List
-
-import requests
-
-# Container pool configuration
-CONTAINER_POOL = {pool_json}
-
-class RotatingProxy:
-    def __init__(self, container_pool: List[Dict]):
-        self.pool = container_pool
-        self.current_index = 0
-
-    def get_random_proxy(self) -> str:
-        """Get a random proxy from the pool"""
-        return random.choice(self.pool)['url'] if self.pool else None
-
-    def get_next_proxy(self) -> str:
-        """Get the next proxy in rotation"""
-        if not self.pool:
-            return None
-        proxy = self.pool[self.current_index]['url']
-        self.current_index = (self.current_index + 1) % len(self.pool)
-        return proxy
-
-    def make_request(self, path="", method="GET", rotate_type="random", **kwargs):
-        """Make a request through a proxy"""
-        if rotate_type == "random":
-            proxy_url = self.get_random_proxy()
-        else:
-            proxy_url = self.get_next_proxy()
-
-        if not proxy_url:
-            print("Error: No proxies available")
-            return None
-
-        full_url = f"{{proxy_url}}{{path}}"
-
-        try:
-            response = requests.request(method, full_url, **kwargs)
-            proxy_ip = next((p['ip'] for p in self.pool if p['url'] == proxy_url), 'unknown')
-            print(f"[OK] Request via: {{proxy_url}} (IP: {{proxy_ip}})")
-            return response
-        except Exception as e:
-            print(f"Error: Request to {{proxy_url}} failed: {{e}}")
-            return None
+    def _get_container_groups(self, names: List[str]) -> Dict[str, Any]:
+        """Fetch the current state of container groups in the pool's resource group
 
-    def test_rotation(self, num_requests=5):
-        """Test IP rotation with multiple requests"""
-        print(f"\\n[ROTATE] Testing IP Rotation with {{num_requests}} requests:")
-        print("-" * 60)
-
-        ips_seen = set()
-        successful = 0
-
-        for i in range(num_requests):
-            print(f"\\nRequest {{i+1}}:")
-            response = self.make_request()
-            if response:
-                successful += 1
-                # Try to extract IP from response
-                if response.headers.get('X-Real-IP'):
-                    ip = response.headers['X-Real-IP']
-                elif 'ip' in response.text.lower():
-                    # Try to extract IP from response body
-                    ip = response.text.strip()[:20]
-                else:
-                    ip = "Response received"
-                ips_seen.add(ip)
-                print(f"  Response: {{ip[:50]}}")
-
-        print("\\n" + "="*60)
-        print(f"[STATS] Test Results:")
-        print(f"  Successful Requests: {{successful}}/{{num_requests}}")
-        print(f"  Unique Responses: {{len(ips_seen)}}")
-        print(f"  Container Pool Size: {{len(self.pool)}}")
-        print(f"  Unique IPs in Pool: {{len(set(c['ip'] for c in self.pool))}}")
-
-def main():
-    proxy = RotatingProxy(CONTAINER_POOL)
-
-    if not CONTAINER_POOL:
-        print("Error: No container pool configured")
-        print("Run: python3 omniprox.py --provider azure-pool --command create --url <target>")
-        return 1
-
-    print(f"[GLOBAL] OmniProx Container Pool Active")
-    print(f"   Pool Size: {{len(CONTAINER_POOL)}} containers")
-    print(f"   Target: {{CONTAINER_POOL[0].get('target', 'unknown')}}")
-
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "test":
-            proxy.test_rotation(int(sys.argv[2]) if len(sys.argv) > 2 else 5)
-        elif sys.argv[1] == "list":
-            print("\\n[LIST] Container Pool:")
-            for i, container in enumerate(CONTAINER_POOL, 1):
-                print(f"  {{i}}. {{container['url']}} (IP: {{container['ip']}})")
-        else:
-            # Make request with provided path
-            response = proxy.make_request(sys.argv[1])
-            if response:
-                print(response.text)
-    else:
-        # Make a single test request
-        response = proxy.make_request()
-        if response:
-            print(f"\\n📄 Response: {{response.text[:200]}}")
+        Groups that cannot be read are left out of the result.
+        """
+        groups = {}
+        if not names:
+            return groups
+
+        with ThreadPoolExecutor(max_workers=min(len(names), 8)) as executor:
+            futures = {
+                executor.submit(self.aci_client.container_groups.get, self.resource_group, name): name
+                for name in names
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    groups[name] = future.result()
+                except Exception as e:
+                    self.logger.debug(f"Could not read container group {name}: {e}")
+        return groups
 
-if __name__ == "__main__":
-    main()
-        ''').strip().format(pool_json=json.dumps(self.container_pool, indent=2))
+    def create_rotation_client(self) -> None:
+        """Create a Python client for rotating through the container pool"""
+        # The client reads the profile's pool file (written by save_pool_config)
+        # rather than embedding the pool, so the script stays the same size
+        # however large the pool is, and loads it with json rather than exec
+        client_script = _render_rotate_client(self._pool_file_path())
 
         # Save the client script
         rotate_path = _get_rotate_client_path()
@@ -595,30 +914,27 @@ if __name__ == "__main__":
         try:
             print("Listing Azure Container Pool...")
 
-            # List all container groups
             all_containers = []
-            container_groups = self.aci_client.container_groups.list()
 
-            for group in container_groups:
+            for group in self._find_omniprox_groups():
                 # Check if it's part of an OmniProx pool
-                if group.tags and group.tags.get('created_by') == 'omniprox':
-                    if group.tags.get('pool_id'):
-                        container_info = {
-                            'name': group.name,
-                            'resource_group': group.id.split('/')[4],
-                            'location': group.location,
-                            'state': group.provisioning_state,
-                            'pool_id': group.tags.get('pool_id'),
-                            'target': group.tags.get('target_url'),
-                            'number': group.tags.get('container_number', '?')
-                        }
+                if group['tags'].get('pool_id'):
+                    container_info = {
+                        'name': group['name'],
+                        'resource_group': group['resource_group'],
+                        'location': group['location'],
+                        'state': group['state'],
+                        'pool_id': group['tags'].get('pool_id'),
+                        'target': group['tags'].get('target_url'),
+                        'number': group['tags'].get('container_number', '?')
+                    }
 
-                        if group.ip_address:
-                            container_info['ip'] = group.ip_address.ip
-                            container_info['fqdn'] = group.ip_address.fqdn
-                            container_info['url'] = f"http://{group.ip_address.fqdn or group.ip_address.ip}"
+                    if group['ip'] or group['fqdn']:
+                        container_info['ip'] = group['ip']
+                        container_info['fqdn'] = group['fqdn']
+                        container_info['url'] = f"http://{group['fqdn'] or group['ip']}"
 
-                        all_containers.append(container_info)
+                    all_containers.append(container_info)
 
             # Group by pool
             pools = {}
@@ -659,6 +975,95 @@ if __name__ == "__main__":
             print(f"Error: {e}")
             return False
 
+    def _find_omniprox_groups(self) -> List[Dict[str, Any]]:
+        """Find container groups tagged created_by=omniprox in the subscription
+
+        Uses one Resource Graph query when azure-mgmt-resourcegraph is installed,
+        falling back to listing every container group and filtering on tags.
+
+        Returns:
+            List of dicts with name, resource_group, location, state, tags, ip and fqdn
+        """
+        if self._ensure_sdk().resourcegraph is not None:
+            try:
+                return self._query_omniprox_groups()
+            except Exception as e:
+                self.logger.debug(f"Resource Graph query failed, listing container groups instead: {e}")
+
+        groups = []
+        for group in self.aci_client.container_groups.list():
+            if group.tags and group.tags.get('created_by') == 'omniprox':
+                groups.append({
+                    'name': group.name,
+                    'resource_group': group.id.split('/')[4],
+                    'location': group.location,
+                    'state': group.provisioning_state,
+                    'tags': group.tags,
+                    'ip': group.ip_address.ip if group.ip_address else None,
+                    'fqdn': group.ip_address.fqdn if group.ip_address else None
+                })
+        return groups
+
+    def _query_omniprox_groups(self) -> List[Dict[str, Any]]:
+        resourcegraph = self._ensure_sdk().resourcegraph
+        if self.graph_client is None:
+            self.graph_client = resourcegraph.ResourceGraphClient(self.credential, transport=self._transport)
+        client = self.graph_client
+        groups = []
+        skip_token = None
+        while True:
+            response = client.resources(resourcegraph.models.QueryRequest(
+                subscriptions=[self.subscription_id],
+                query=_OMNIPROX_GROUPS_QUERY,
+                options=resourcegraph.models.QueryRequestOptions(
+                    result_format=resourcegraph.models.ResultFormat.OBJECT_ARRAY,
+                    skip_token=skip_token
+                )
+            ))
+            for row in response.data:
+                groups.append({
+                    'name': row['name'],
+                    'resource_group': row['resourceGroup'],
+                    'location': row.get('location'),
+                    'state': row.get('state') or None,
+                    'tags': row.get('tags') or {},
+                    'ip': row.get('ip') or None,
+                    'fqdn': row.get('fqdn') or None
+                })
+            skip_token = response.skip_token
+            if not skip_token:
+                return groups
+
+    def _delete_container_groups(self, targets: List[tuple]) -> int:
+        """Delete (resource_group, name) container groups, returning how many succeeded
+
+        Deletions run on a thread pool so their long-running operations overlap
+        instead of running back to back; results are reported as they finish.
+        """
+        if not targets:
+            return 0
+
+        deleted = 0
+        with ThreadPoolExecutor(max_workers=min(len(targets), 16)) as executor:
+            futures = {}
+            for resource_group, name in targets:
+                print(f"Deleting {name}...")
+                futures[executor.submit(self._delete_container_group, resource_group, name)] = name
+
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    future.result()
+                    deleted += 1
+                    print(f"  [OK] Deleted {name}")
+                except Exception as e:
+                    print(f"  Error: Failed to delete {name}: {e}")
+
+        return deleted
+
+    def _delete_container_group(self, resource_group: str, name: str) -> None:
+        self.aci_client.container_groups.begin_delete(resource_group, name).result()
+
     def delete(self):
         """Delete a specific container or entire pool"""
         if not self.init_provider():
@@ -696,18 +1101,9 @@ if __name__ == "__main__":
 
             print(f"Deleting container pool ({len(self.container_pool)} containers)...")
 
-            deleted = 0
-            for container in self.container_pool:
-                try:
-                    print(f"Deleting {container['name']}...")
-                    self.aci_client.container_groups.begin_delete(
-                        self.resource_group,
-                        container['name']
-                    ).result()
-                    deleted += 1
-                    print(f"  [OK] Deleted {container['name']}")
-                except Exception as e:
-                    print(f"  Error: Failed to delete {container['name']}: {e}")
+            deleted = self._delete_container_groups(
+                [(self.resource_group, container['name']) for container in self.container_pool]
+            )
 
             # Clear pool configuration
             self.container_pool = []
@@ -725,16 +1121,24 @@ if __name__ == "__main__":
             print("Finding all OmniProx container pools...")
 
             # Find all OmniProx containers
-            container_groups = self.aci_client.container_groups.list()
-            omniprox_containers = []
+            omniprox_containers = [
+                {
+                    'name': group['name'],
+                    'resource_group': group['resource_group'],
+                    'pool_id': group['tags'].get('pool_id', 'unknown')
+                }
+                for group in self._find_omniprox_groups()
+            ]
 
-            for group in container_groups:
-                if group.tags and group.tags.get('created_by') == 'omniprox':
-                    resource_group = group.id.split('/')[4]
+            # Resource Graph can lag behind a pool created moments ago
+            found = {(c['resource_group'].lower(), c['name']) for c in omniprox_containers}
+            for container in self.container_pool:
+                if self.resource_group and container.get('name') and \
+                        (self.resource_group.lower(), container['name']) not in found:
                     omniprox_containers.append({
-                        'name': group.name,
-                        'resource_group': resource_group,
-                        'pool_id': group.tags.get('pool_id', 'unknown')
+                        'name': container['name'],
+                        'resource_group': self.resource_group,
+                        'pool_id': 'configured'
                     })
 
             if not omniprox_containers:
@@ -758,17 +1162,9 @@ if __name__ == "__main__":
                 return False
 
             # Delete all containers
-            deleted = 0
-            for container in omniprox_containers:
-                try:
-                    print(f"Deleting {container['name']}...")
-                    self.aci_client.container_groups.begin_delete(
-                        container['resource_group'],
-                        container['name']
-                    ).result()
-                    deleted += 1
-                except Exception as e:
-                    print(f"  Failed to delete {container['name']}: {e}")
+            deleted = self._delete_container_groups(
+                [(container['resource_group'], container['name']) for container in omniprox_containers]
+            )
 
             # Clear saved pool configuration
             self.container_pool = []
@@ -788,13 +1184,11 @@ if __name__ == "__main__":
 
     def create_profile(self, config, profile_name):
         """Create a new profile configuration"""
-        self.config = config
         config[profile_name] = {
             'subscription_id': '',
             'location': 'eastus',
             'resource_group': '',
-            'use_cli': 'true',
-            'container_pool': '[]'
+            'use_cli': 'true'
         }
 
     def update(self):
@@ -816,6 +1210,30 @@ if __name__ == "__main__":
 
         return True
 
+    def _run_rotate_client(self, args: List[str], timeout: int) -> None:
+        """Run the rotation client's main() in this process
+
+        Saves starting a second interpreter. The client comes from the packaged
+        template rather than the script in the temp dir, which anyone could replace.
+        """
+        try:
+            client = _load_rotate_client(self._pool_file_path())
+        except Exception as e:
+            print(f"Error: Could not load the container pool: {e}")
+            return
+
+        stop = threading.Event()
+        worker = threading.Thread(target=client['main'], args=(args, stop), daemon=True)
+        worker.start()
+        worker.join(timeout)
+        if worker.is_alive():
+            # A thread cannot be killed, so the client is told to stop; it drops any
+            # late results, and waiting for it means requests already in flight
+            # (each bounded by its own timeout) have closed their connections
+            stop.set()
+            print(f"\nRotation test timed out after {timeout}s")
+            worker.join()
+
     def proxytest(self):
         """Test IP rotation with the container pool"""
         if not self.container_pool:
@@ -833,35 +1251,24 @@ if __name__ == "__main__":
                 print("[TEST] TESTING IP ROTATION")
                 print("="*60)
 
-                rotate_path = _get_rotate_client_path()
-                result = subprocess.run(
-                    ['python3', str(rotate_path), 'test', '10'],
-                    capture_output=True,
-                    text=True,
-                    timeout=120
-                )
-                print(result.stdout)
+                self._run_rotate_client(['test', '10'], timeout=120)
 
-                # Offer to clean up
+                # Offer to clean up, without hanging unattended runs
                 try:
-                    cleanup = input("\n[CLEAN] Delete test containers? (yes/no): ").strip().lower()
-                    if cleanup == 'yes':
+                    cleanup = input_with_timeout("\n[CLEAN] Delete test containers? (yes/no): ", 30)
+                    if cleanup is None:
+                        print("No answer after 30s, keeping test containers")
+                        print("Run 'omniprox --provider azure --command cleanup' to clean up manually")
+                    elif cleanup.strip().lower() == 'yes':
                         self.cleanup()
                 except (EOFError, KeyboardInterrupt):
                     print("\nSkipping cleanup (non-interactive mode)")
-                    print(f"Run 'omniprox --provider azure --command cleanup' to clean up manually")
+                    print("Run 'omniprox --provider azure --command cleanup' to clean up manually")
 
             self.url = original_url
         else:
             # Test existing pool
             print("Testing existing container pool...")
-            rotate_path = _get_rotate_client_path()
-            result = subprocess.run(
-                ['python3', str(rotate_path), 'test'],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            print(result.stdout)
+            self._run_rotate_client(['test'], timeout=60)
 
         return True
\ No newline at end of file
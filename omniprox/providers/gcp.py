@@ -15,7 +15,7 @@ import time
 import subprocess
 import warnings
 import os
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Mapping
 from pathlib import Path
 from contextlib import contextmanager
 
@@ -115,7 +115,7 @@ class GCPProvider(BaseOmniProx):
         self.save_profile(config)
         self.load_profile(config, profile_name)
 
-    def load_profile(self, config: configparser.ConfigParser, profile_name: str):
+    def load_profile(self, config: Mapping[str, Mapping[str, str]], profile_name: str):
         """Load GCP profile from configuration"""
 
         if profile_name in config:
@@ -199,6 +199,11 @@ class GCPProvider(BaseOmniProx):
         if not HAS_GCP_LIBS:
             return False
 
+        # Bootstrap once per provider instance; proxytest initialises up front and
+        # then creates from several threads, which all share these clients
+        if self.api_client is not None:
+            return True
+
         # Auto-generate project ID if not set or project doesn't exist
         if not self.project_id or not self._project_exists(self.project_id):
             self.project_id = self._create_or_get_project()
@@ -343,15 +348,12 @@ class GCPProvider(BaseOmniProx):
     def _update_profile_project(self, project_id: str):
         """Update the profile configuration with new project ID"""
         try:
-            config_path = Path.home() / '.omniprox' / 'profiles.ini'
-            config = configparser.ConfigParser()
-            config.read(config_path)
+            config = self._writable_config()
 
             profile_name = f"{self.provider}:{self.profile}"
             if profile_name in config:
                 config[profile_name]['project_id'] = project_id
-                with open(config_path, 'w') as f:
-                    config.write(f)
+                self.save_profile(config)
                 self.logger.info(f"Updated profile with project ID: {project_id}")
         except Exception as e:
             self.logger.error(f"Error updating profile: {e}")
@@ -646,7 +648,7 @@ class GCPProvider(BaseOmniProx):
             # Check if API already exists (unlikely for test suffix, but check anyway)
             existing_url = self._get_existing_api_url(api_id)
             if existing_url:
-                self._last_created_url = existing_url
+                self._record_created_proxy_url(existing_url)
                 return True
 
             # Create API
@@ -707,7 +709,7 @@ class GCPProvider(BaseOmniProx):
             gateway_result = gateway_operation.result(timeout=self.TIMEOUT_VERY_LONG)
 
             gateway_url = f"https://{gateway_result.default_hostname}"
-            self._last_created_url = gateway_url
+            self._record_created_proxy_url(gateway_url)
             return True
 
         except google_exceptions.AlreadyExists:
@@ -716,10 +718,6 @@ class GCPProvider(BaseOmniProx):
             self.logger.error(f"Failed to create API Gateway: {e}")
             return False
 
-    def _get_last_created_proxy_url(self) -> str:
-        """Get the URL of the last created proxy for testing"""
-        return getattr(self, '_last_created_url', None)
-
     def list(self):
         """List all GCP API Gateway proxies"""
         if not self.init_provider():